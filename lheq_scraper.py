@@ -4,7 +4,41 @@ import json
 import os
 import requests
 import urllib.parse
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional on-disk HTTP cache for immutable game data
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional fast JSON parsing/serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(filename, data):
+    """Write data to an indented UTF-8 JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 class FinalWorkingLHEQScraper:
     def __init__(self):
@@ -22,6 +56,42 @@ class FinalWorkingLHEQScraper:
         os.makedirs("web/data/games", exist_ok=True)
         os.makedirs("logs", exist_ok=True)
 
+        # Reuse one pooled session for every API and PDF request (keep-alive)
+        self.session = self.create_session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://pub-api.play.spordle.com", adapter)
+        self.session.mount("https://pdf.play.spordle.com", adapter)
+
+        # Detail requests are independent and run in parallel, across up to
+        # detail_window completed games at a time
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.detail_window = 8
+        self._roster_futures = {}
+
+        # Team rosters fetched during this run, keyed by team_id
+        self._roster_cache = {}
+
+    def create_session(self):
+        """Create the HTTP session, backed by an on-disk cache when requests-cache is installed"""
+        if requests_cache is None:
+            return requests.Session()
+
+        # The games list must stay fresh so newly completed games are picked up;
+        # boxscores, game details and rosters are cached. PDFs are already kept on disk.
+        return requests_cache.CachedSession(
+            'logs/lheq_http_cache',
+            backend='sqlite',
+            cache_control=True,
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after={
+                'pub-api.play.spordle.com/api/sp/games/*': timedelta(days=30),
+                'pub-api.play.spordle.com/api/sp/members*': timedelta(days=1),
+            },
+            allowable_codes=(200,)
+        )
+
     def build_api_url(self, start_date, end_date, skip=0):
         """Build the API URL with proper filters"""
         filter_obj = {
@@ -47,13 +117,12 @@ class FinalWorkingLHEQScraper:
                     }
                 ]
             },
+            # Only what process_games reads from the list; completed games
+            # get their full details from fetch_game_details_with_players
             "include": [
                 "teamStats",
-                "surface",
-                "office",
                 "awayTeam",
-                "homeTeam",
-                "externalProviders"
+                "homeTeam"
             ]
         }
 
@@ -71,14 +140,18 @@ class FinalWorkingLHEQScraper:
         skip = 0
         batch_size = 100
 
+        # Only `skip` changes between pages, so serialize and encode the filter once
+        url_template = self.build_api_url(start_date, end_date, skip="__SKIP__")
+        skip_token = urllib.parse.quote('"__SKIP__"')
+
         while True:
-            api_url = self.build_api_url(start_date, end_date, skip)
+            api_url = url_template.replace(skip_token, str(skip))
 
             try:
-                response = requests.get(api_url, headers=self.headers, timeout=30)
+                response = self.session.get(api_url, timeout=30)
                 response.raise_for_status()
 
-                data = response.json()
+                data = json_loads(response.content)
                 games_batch = data if isinstance(data, list) else data.get('data', [])
 
                 if not games_batch:
@@ -92,7 +165,7 @@ class FinalWorkingLHEQScraper:
 
                 skip += len(games_batch)
 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 print(f"❌ Error fetching games: {e}")
                 break
 
@@ -134,6 +207,10 @@ class FinalWorkingLHEQScraper:
 
     def fetch_team_members(self, team_id):
         """Fetch complete team roster using members endpoint"""
+        # Each team's roster is only fetched once per run
+        if team_id in self._roster_cache:
+            return self._roster_cache[team_id]
+
         # Build filter for all team positions
         team_filter = {
             "where": {
@@ -150,10 +227,12 @@ class FinalWorkingLHEQScraper:
         members_url = f"https://pub-api.play.spordle.com/api/sp/members?filter={filter_encoded}"
 
         try:
-            response = requests.get(members_url, headers=self.headers, timeout=30)
+            response = self.session.get(members_url, timeout=30)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            members = json_loads(response.content)
+            self._roster_cache[team_id] = members
+            return members
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"⚠️ Error fetching team members for team {team_id}: {e}")
             return None
 
@@ -162,10 +241,10 @@ class FinalWorkingLHEQScraper:
         boxscore_url = f"{self.api_base_url}/{game_id}/boxScore"
 
         try:
-            response = requests.get(boxscore_url, headers=self.headers, timeout=30)
+            response = self.session.get(boxscore_url, timeout=30)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"⚠️ Error fetching boxscore for game {game_id}: {e}")
             return None
 
@@ -177,10 +256,10 @@ class FinalWorkingLHEQScraper:
         details_url = f"{self.api_base_url}/{game_id}?filter={filter_encoded}"
 
         try:
-            response = requests.get(details_url, headers=self.headers, timeout=30)
+            response = self.session.get(details_url, timeout=30)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"⚠️ Error fetching game details for game {game_id}: {e}")
             return None
 
@@ -188,25 +267,30 @@ class FinalWorkingLHEQScraper:
         """Download the PDF gamesheet for a completed game"""
         filename = f"web/data/gamesheets/game_{game_id}.pdf"
 
-        # Check if PDF already exists
-        if os.path.exists(filename):
+        # Check if PDF already exists (an empty file is a failed earlier download)
+        if os.path.exists(filename) and os.path.getsize(filename) > 0:
             print(f"📄 PDF already exists: {filename}")
             return filename
 
         pdf_url = f"https://pdf.play.spordle.com/game/{game_id}?locale=fr"
 
         try:
-            response = requests.get(pdf_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            # Stream to disk in chunks instead of buffering the whole PDF
+            with self.session.get(pdf_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
 
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+                with open(filename, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
 
             print(f"📄 Downloaded PDF: {filename}")
             return filename
 
         except requests.exceptions.RequestException as e:
             print(f"⚠️ Error downloading PDF for game {game_id}: {e}")
+            # Don't leave a truncated PDF behind
+            if os.path.exists(filename):
+                os.remove(filename)
             return None
 
     def save_individual_game_file(self, game_data):
@@ -215,8 +299,7 @@ class FinalWorkingLHEQScraper:
         filename = f"web/data/games/game_{game_id}.json"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, indent=2, ensure_ascii=False)
+            write_json(filename, game_data)
             print(f"   💾 Game data saved: {filename}")
             return filename
         except Exception as e:
@@ -236,8 +319,8 @@ class FinalWorkingLHEQScraper:
             return False  # File doesn't exist, don't skip
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                existing_game = json.load(f)
+            with open(filename, 'rb') as f:
+                existing_game = json_loads(f.read())
                 status = existing_game.get('status', '').upper()
 
                 # Only skip if status is FINAL
@@ -307,6 +390,69 @@ class FinalWorkingLHEQScraper:
             print(f"  Error extracting goalies with Gemini: {e}")
             return None
 
+    def _submit_roster_fetch(self, team_id):
+        """Submit a team roster fetch, sharing one request between games still in flight"""
+        future = self._roster_futures.get(team_id)
+        # A failed fetch isn't cached by fetch_team_members, so later games retry it
+        if future is None or (future.done() and (future.exception() is not None or future.result() is None)):
+            future = self.executor.submit(self.fetch_team_members, team_id)
+            self._roster_futures[team_id] = future
+        return future
+
+    def _submit_detail_fetches(self, game):
+        """Submit the boxscore, details, rosters and PDF requests of a completed game"""
+        game_id = game.get('id')
+        home_team_id = game.get('homeTeamId')
+        away_team_id = game.get('awayTeamId')
+
+        return {
+            'boxscore': self.executor.submit(self.fetch_boxscore, game_id),
+            'details': self.executor.submit(self.fetch_game_details_with_players, game_id),
+            'home_roster': self._submit_roster_fetch(home_team_id) if home_team_id else None,
+            'away_roster': self._submit_roster_fetch(away_team_id) if away_team_id else None,
+            'pdf': self.executor.submit(self.download_gamesheet_pdf, game_id)
+        }
+
+    def _collect_detail_fetches(self, processed_game, futures):
+        """Wait for a game's detail requests and add their results to processed_game"""
+        # Boxscore (goals, assists, penalties)
+        boxscore = futures['boxscore'].result()
+        if boxscore:
+            processed_game['boxscore'] = boxscore
+            print(f"   ✅ Boxscore data fetched")
+
+        # Detailed game info with players
+        game_details = futures['details'].result()
+        if game_details:
+            processed_game['detailed_game_info'] = game_details
+            print(f"   ✅ Player details fetched")
+
+        # Complete team rosters
+        if futures['home_roster']:
+            home_members = futures['home_roster'].result()
+            if home_members:
+                processed_game['home_team_roster'] = home_members
+                print(f"   ✅ Home team roster fetched ({len(home_members)} members)")
+
+        if futures['away_roster']:
+            away_members = futures['away_roster'].result()
+            if away_members:
+                processed_game['away_team_roster'] = away_members
+                print(f"   ✅ Away team roster fetched ({len(away_members)} members)")
+
+        # PDF gamesheet
+        pdf_filename = futures['pdf'].result()
+        if pdf_filename:
+            processed_game['gamesheet_pdf_file'] = pdf_filename
+
+            # Extract starting goalies using Gemini AI
+            starting_goalies = self.extract_starting_goalies(pdf_filename)
+            if starting_goalies:
+                processed_game['starting_goalies'] = starting_goalies
+                print(f"   🥅 Starting goalies extracted")
+            else:
+                print(f"   ❌ Could not extract starting goalies")
+
     def process_games(self, api_games, fetch_detailed_stats=True):
         """Process games from API data with optional detailed stats fetching"""
         print(f"🔄 Processing {len(api_games)} games from API...")
@@ -315,6 +461,34 @@ class FinalWorkingLHEQScraper:
         scheduled_games = []
         skipped_count = 0
 
+        # Games whose detail requests are in flight, finished and saved in API order.
+        # Up to detail_window games are fetched at once; the executor bounds the requests
+        pending = deque()
+        self._roster_futures = {}
+
+        def finish_game(processed_game, futures):
+            try:
+                if futures:
+                    print(f"📥 Collecting detailed stats for game {processed_game['id']}...")
+                    self._collect_detail_fetches(processed_game, futures)
+
+                # Save individual game file
+                individual_file = self.save_individual_game_file(processed_game)
+                if individual_file:
+                    processed_game['individual_file'] = individual_file
+
+                game_label = f"{processed_game['away_team']} vs {processed_game['home_team']}"
+                if processed_game['status'] == 'FINAL':
+                    final_games.append(processed_game)
+                    print(f"✅ FINAL: {game_label} - {processed_game['away_score']}-{processed_game['home_score']} "
+                          f"(ID: {processed_game['id']})")
+                else:
+                    scheduled_games.append(processed_game)
+                    print(f"📅 SCHEDULED: {game_label} on {processed_game['date']} (ID: {processed_game['id']})")
+
+            except Exception as e:
+                print(f"⚠️ Error processing game: {e}")
+
         for i, game in enumerate(api_games, 1):
             try:
                 game_id = game.get('id')
@@ -359,67 +533,25 @@ class FinalWorkingLHEQScraper:
                     'gamesheet_pdf_url': f"https://pdf.play.spordle.com/game/{game_id}?locale=fr" if is_completed else None
                 }
 
-                # Fetch detailed stats for completed games
+                # Start fetching detailed stats for completed games
+                futures = None
                 if is_completed and fetch_detailed_stats:
                     print(f"📊 [{i}/{len(api_games)}] Fetching detailed stats for game {game_id}...")
-
-                    # Fetch boxscore (goals, assists, penalties)
-                    boxscore = self.fetch_boxscore(game_id)
-                    if boxscore:
-                        processed_game['boxscore'] = boxscore
-                        print(f"   ✅ Boxscore data fetched")
-
-                    # Fetch detailed game info with players
-                    game_details = self.fetch_game_details_with_players(game_id)
-                    if game_details:
-                        processed_game['detailed_game_info'] = game_details
-                        print(f"   ✅ Player details fetched")
-
-                    # Fetch complete team rosters
-                    home_team_id = game.get('homeTeamId')
-                    away_team_id = game.get('awayTeamId')
-
-                    if home_team_id:
-                        home_members = self.fetch_team_members(home_team_id)
-                        if home_members:
-                            processed_game['home_team_roster'] = home_members
-                            print(f"   ✅ Home team roster fetched ({len(home_members)} members)")
-
-                    if away_team_id:
-                        away_members = self.fetch_team_members(away_team_id)
-                        if away_members:
-                            processed_game['away_team_roster'] = away_members
-                            print(f"   ✅ Away team roster fetched ({len(away_members)} members)")
-
-                    # Download PDF gamesheet
-                    pdf_filename = self.download_gamesheet_pdf(game_id)
-                    if pdf_filename:
-                        processed_game['gamesheet_pdf_file'] = pdf_filename
-
-                        # Extract starting goalies using Gemini AI
-                        starting_goalies = self.extract_starting_goalies(pdf_filename)
-                        if starting_goalies:
-                            processed_game['starting_goalies'] = starting_goalies
-                            print(f"   🥅 Starting goalies extracted")
-                        else:
-                            print(f"   ❌ Could not extract starting goalies")
-
-                # Save individual game file
-                individual_file = self.save_individual_game_file(processed_game)
-                if individual_file:
-                    processed_game['individual_file'] = individual_file
-
-                if is_completed:
-                    final_games.append(processed_game)
-                    print(f"✅ FINAL: {away_team_name} vs {home_team_name} - {away_score}-{home_score} (ID: {game_id})")
-                else:
-                    scheduled_games.append(processed_game)
-                    print(f"📅 SCHEDULED: {away_team_name} vs {home_team_name} on {date_str} (ID: {game_id})")
+                    futures = self._submit_detail_fetches(game)
 
             except Exception as e:
                 print(f"⚠️ Error processing game: {e}")
                 continue
 
+            pending.append((processed_game, futures))
+
+            # Finish the oldest game once the window is full
+            while len(pending) > self.detail_window:
+                finish_game(*pending.popleft())
+
+        while pending:
+            finish_game(*pending.popleft())
+
         print(f"\n📊 SUMMARY:")
         print(f"   ⏭️ SKIPPED games: {skipped_count}")
         print(f"   ✅ FINAL games: {len(final_games)}")
@@ -472,8 +604,7 @@ class FinalWorkingLHEQScraper:
                 'all_games': all_games
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, indent=2, ensure_ascii=False)
+            write_json(filename, result_data)
 
             print(f"\n🏆 API SCRAPING COMPLETE!")
             print(f"📊 Total games found: {len(all_games)}")
@@ -520,6 +651,9 @@ class FinalWorkingLHEQScraper:
         except Exception as e:
             print(f"❌ Scraper error: {e}")
             return [], [], 0
+        finally:
+            self.executor.shutdown()
+            self.session.close()
 
 if __name__ == "__main__":
     import sys
@@ -10,29 +10,145 @@ This script combines:
 - Formation/line combination analysis
 """
 
+import functools
+import heapq
 import json
 import os
 import sys
 import re
+import shutil
 import argparse
+import unicodedata
 import requests
 import urllib.parse
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
-from itertools import combinations
+from itertools import combinations, groupby
+from operator import attrgetter, itemgetter
+from requests.adapters import HTTPAdapter
 
-# Gemini AI support check
+# Optional fast JSON parsing/serialization
 try:
-    import subprocess
-    # Test if gemini command is available
-    result = subprocess.run(['which', 'gemini'], capture_output=True, text=True)
-    GEMINI_SUPPORT = result.returncode == 0
-    if not GEMINI_SUPPORT:
-        print("Warning: Gemini AI command not found. Starting goalie parsing will be skipped.")
-except Exception:
-    GEMINI_SUPPORT = False
-    print("Warning: Gemini AI command not available. Starting goalie parsing will be skipped.")
+    import orjson
+except ImportError:
+    orjson = None
+
+# RapidFuzz support check (C++ fuzzy matching). Its ratio is LCS-based and can be higher
+# than difflib's SequenceMatcher ratio, so it is only used to prefilter candidates
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_SUPPORT = True
+except ImportError:
+    RAPIDFUZZ_SUPPORT = False
+
+# Gemini AI support check (PATH lookup, no need to spawn `which`)
+GEMINI_SUPPORT = shutil.which('gemini') is not None
+if not GEMINI_SUPPORT:
+    print("Warning: Gemini AI command not found. Starting goalie parsing will be skipped.")
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(filename, data):
+    """Write data to an indented UTF-8 JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Penalty duration keywords (English/French) and their length in minutes, in match order
+PENALTY_DURATIONS = (
+    ('Minor', 2),
+    ('Mineure', 2),
+    ('Major', 5),
+    ('Majeure', 5),
+    ('Misconduct', 10),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def penalty_minutes(duration_name):
+    """Penalty length in minutes for a duration name (e.g. 'Game Misconduct'), default 2"""
+    for keyword, minutes in PENALTY_DURATIONS:
+        if keyword in duration_name:
+            return minutes
+    return 2
+
+
+def sorted_pair(a, b):
+    """Sorted key for two player ids, without building a list to sort"""
+    return (a, b) if a < b else (b, a)
+
+
+def sorted_trio(a, b, c):
+    """Sorted key for three player ids using a three-comparison sorting network"""
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+    if a > b:
+        a, b = b, a
+    return (a, b, c)
+
+
+# Accented Latin-1 letters found in French names, mapped to the base letter NFD stripping gives
+ACCENT_TABLE = str.maketrans(
+    'àáâãäåçèéêëìíîïñòóôõöùúûüýÿÀÁÂÃÄÅÇÈÉÊËÌÍÎÏÑÒÓÔÕÖÙÚÛÜÝ',
+    'aaaaaaceeeeiiiinooooouuuuyyAAAAAACEEEEIIIINOOOOOUUUUY'
+)
+
+
+def read_game_file(file_path):
+    """
+    Read and parse one game file, returning (game_data, error).
+    game_data is None when the raw bytes show the game can't be FINAL.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        # Cheap byte scan first: only files that can be FINAL with a boxscore are decoded
+        if b'"FINAL"' not in raw or b'"boxscore"' not in raw:
+            return None, None
+
+        return json_loads(raw), None
+    except Exception as e:
+        return None, e
+
+
+def iter_final_games(games_dir, chunk_size=64):
+    """
+    Yield FINAL games with a boxscore from games_dir, in directory order.
+    Files are read on a thread pool one chunk at a time, so only about
+    chunk_size parsed games are held in memory at once.
+    """
+    with os.scandir(games_dir) as it:
+        paths = [entry.path for entry in it if entry.name.endswith('.json') and entry.is_file()]
+
+    # Load errors are collected and printed once, after the last file is read
+    error_lines = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for start in range(0, len(paths), chunk_size):
+            chunk = paths[start:start + chunk_size]
+            for path, (game_data, error) in zip(chunk, executor.map(read_game_file, chunk)):
+                if error is not None:
+                    error_lines.append(f"  Error loading {os.path.basename(path)}: {error}")
+                elif game_data is not None and game_data.get('status') == 'FINAL' and 'boxscore' in game_data:
+                    yield game_data
+
+    if error_lines:
+        print('\n'.join(error_lines))
 
 
 # ============================================================================
@@ -42,12 +158,43 @@ except Exception:
 class StartingGoalieParser:
     """Parse PDF gamesheets to identify starting goalies and add them to game JSON files"""
 
-    def __init__(self, gamesheet_dir='web/data/gamesheets', game_dir='web/data/games'):
+    # Compiled once at class load instead of per gamesheet
+    _GAME_ID_PATTERN = re.compile(r'game_(\d+)')
+    _GAME_FILE_PATTERN = re.compile(r'game_(\d+)_')
+
+    def __init__(self, gamesheet_dir='web/data/gamesheets', game_dir='web/data/games', max_workers=4,
+                 cache_file='starting_goalies_cache.json', batch_size=8):
         self.gamesheet_dir = gamesheet_dir
         self.game_dir = game_dir
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.cache_file = cache_file
+        self.parse_cache = {}
         self.processed_count = 0
         self.skipped_count = 0
 
+    def load_parse_cache(self):
+        """Load cached gamesheet parse results keyed by game_id, mtime and size"""
+        self.parse_cache = {}
+        if not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.parse_cache = json.load(f)
+        except Exception as e:
+            print(f"  Error loading parse cache {self.cache_file}: {e}")
+
+    def save_parse_cache(self):
+        """Atomically write the gamesheet parse cache"""
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.parse_cache, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"  Error saving parse cache {self.cache_file}: {e}")
+
     def has_starting_goalies(self, game_data):
         """Check if game already has starting goalie data"""
         return 'starting_goalies' in game_data and game_data['starting_goalies'] is not None
@@ -74,91 +221,183 @@ class StartingGoalieParser:
             print(f"  Error parsing {pdf_path}: {e}")
             return None
 
-    def _extract_goalies_with_gemini(self, pdf_path):
-        """Extract starting goalies using Gemini AI"""
+    def parse_gamesheet_batch(self, pdf_paths, game_teams=None):
+        """
+        Parse several PDF gamesheets with a single Gemini call
+        game_teams optionally lists each game's (home team, away team) names
+        Returns a list of results in the same order as pdf_paths
+        """
+        if not GEMINI_SUPPORT or len(pdf_paths) == 1:
+            return [self.parse_gamesheet(pdf_path) for pdf_path in pdf_paths]
+
+        try:
+            results = self._extract_goalies_batch_with_gemini(pdf_paths)
+        except Exception as e:
+            print(f"  Error parsing gamesheet batch: {e}")
+            results = None
+
+        if results is None:
+            # Fall back to one call per gamesheet
+            print("  Batch extraction failed - parsing gamesheets one by one")
+            return [self.parse_gamesheet(pdf_path) for pdf_path in pdf_paths]
+
+        # Batch results are matched to PDFs by position, so a result whose team names fit
+        # another game of the batch at least as well as its own is re-parsed on its own
+        if game_teams:
+            for i, result in enumerate(results):
+                if result is None:
+                    continue
+                scores = [self._team_match_score(result, teams) for teams in game_teams]
+                if not scores[i] or any(score >= scores[i] for j, score in enumerate(scores) if j != i):
+                    print(f"  Teams in batch result don't match {os.path.basename(pdf_paths[i])} - parsing it alone")
+                    results[i] = self.parse_gamesheet(pdf_paths[i])
+
+        return results
+
+    @staticmethod
+    def _team_match_score(result, teams):
+        """How well a parse result's team names match a game's (home team, away team) names"""
+        home_team, away_team = teams
+        score = 0.0
+        for goalie in result['goalies']:
+            expected = home_team if goalie['type'] == 'home' else away_team
+            if goalie['team'] and expected:
+                score += SequenceMatcher(None, goalie['team'].translate(ACCENT_TABLE),
+                                         expected.upper().translate(ACCENT_TABLE)).ratio()
+        return score
+
+    def _run_gemini(self, prompt, pdf_paths, timeout=60):
+        """Run the Gemini CLI on the given PDFs, returning its stdout or None on failure"""
         import subprocess
-        import json
-        import os
+
+        # Flash model, same as the scraper: reading one asterisk off a
+        # single-page gamesheet doesn't need the larger model
+        cmd = ["gemini", "-m", "gemini-2.5-flash", prompt]
+        cmd.extend(f"@{os.path.abspath(pdf_path)}" for pdf_path in pdf_paths)
+        print(f"  Running Gemini AI extraction...")
 
         try:
-            # Get the absolute path for the PDF
-            abs_pdf_path = os.path.abspath(pdf_path)
-
-            # Construct the Gemini command
-            prompt = (
-                "extrait moi les gardiens partant du pdf suivant (à noter que le gardien partant possède un * à coté de son nom). "
-                "donne seulement ta réponse dans le format json. le format devra respecter le format suivant en exemple : "
-                '{"visiteurs": {"equipe": "COLLEGE FRANCAIS RIVE-SUD", "gardien_partant": "LUCAS LESSARD"}, '
-                '"locaux": {"equipe": "LIONS LAC ST-LOUIS", "gardien_partant": "BRENDAN BOILY"}}'
-            )
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            print("  Gemini command timed out")
+            return None
+        except Exception as e:
+            print(f"  Error calling Gemini: {e}")
+            return None
 
-            # Run Gemini command
-            cmd = ["gemini", prompt, f"@{abs_pdf_path}"]
-            print(f"  Running Gemini AI extraction...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            print(f"  Gemini command failed: {result.stderr}")
+            return None
 
-            if result.returncode != 0:
-                print(f"  Gemini command failed: {result.stderr}")
-                return None
+        return result.stdout
 
-            # Parse JSON response (remove markdown code blocks if present)
-            try:
-                response_text = result.stdout.strip()
-                # Remove markdown code blocks if present
-                if response_text.startswith('```json'):
-                    response_text = response_text.replace('```json', '').replace('```', '').strip()
-                elif response_text.startswith('```'):
-                    response_text = response_text.replace('```', '').strip()
-
-                gemini_data = json.loads(response_text)
-                print(f"  Gemini response: {gemini_data}")
-
-                # Convert Gemini format to our internal format
-                starting_goalies = []
-
-                if 'visiteurs' in gemini_data and 'gardien_partant' in gemini_data['visiteurs']:
-                    away_goalie = gemini_data['visiteurs']['gardien_partant']
-                    if away_goalie:
-                        starting_goalies.append({
-                            'number': 0,  # No number from Gemini
-                            'name': away_goalie.upper(),
-                            'team': gemini_data['visiteurs'].get('equipe', '').upper(),
-                            'type': 'away'
-                        })
-                        print(f"  Found away starting goalie: {away_goalie}")
-
-                if 'locaux' in gemini_data and 'gardien_partant' in gemini_data['locaux']:
-                    home_goalie = gemini_data['locaux']['gardien_partant']
-                    if home_goalie:
-                        starting_goalies.append({
-                            'number': 0,  # No number from Gemini
-                            'name': home_goalie.upper(),
-                            'team': gemini_data['locaux'].get('equipe', '').upper(),
-                            'type': 'home'
-                        })
-                        print(f"  Found home starting goalie: {home_goalie}")
+    def _convert_gemini_goalies(self, gemini_data):
+        """Convert one Gemini gamesheet object to our internal format"""
+        starting_goalies = []
 
-                if starting_goalies:
-                    return {
-                        'goalies': starting_goalies,
-                        'count': len(starting_goalies)
-                    }
-                else:
-                    print("  No starting goalies found in Gemini response")
-                    return None
+        if not isinstance(gemini_data, dict):
+            print("  Unexpected Gemini response format")
+            return None
 
-            except json.JSONDecodeError as e:
-                print(f"  Failed to parse Gemini JSON response: {e}")
-                print(f"  Raw response: {result.stdout}")
+        for side, goalie_type in (('visiteurs', 'away'), ('locaux', 'home')):
+            side_data = gemini_data.get(side)
+            if not isinstance(side_data, dict):
+                continue
+            goalie_name = side_data.get('gardien_partant')
+            team_name = side_data.get('equipe') or ''
+            if goalie_name and isinstance(goalie_name, str):
+                starting_goalies.append({
+                    'number': 0,  # No number from Gemini
+                    'name': goalie_name.upper(),
+                    'team': team_name.upper() if isinstance(team_name, str) else '',
+                    'type': goalie_type
+                })
+                print(f"  Found {goalie_type} starting goalie: {goalie_name}")
+
+        if starting_goalies:
+            return {
+                'goalies': starting_goalies,
+                'count': len(starting_goalies)
+            }
+        else:
+            print("  No starting goalies found in Gemini response")
+            return None
+
+    def _extract_goalies_with_gemini(self, pdf_path):
+        """Extract starting goalies using Gemini AI"""
+        prompt = (
+            "extrait moi les gardiens partant du pdf suivant (à noter que le gardien partant possède un * à coté de son nom). "
+            "donne seulement ta réponse dans le format json. le format devra respecter le format suivant en exemple : "
+            '{"visiteurs": {"equipe": "COLLEGE FRANCAIS RIVE-SUD", "gardien_partant": "LUCAS LESSARD"}, '
+            '"locaux": {"equipe": "LIONS LAC ST-LOUIS", "gardien_partant": "BRENDAN BOILY"}}'
+        )
+
+        response_text = self._run_gemini(prompt, [pdf_path])
+        if response_text is None:
+            return None
+
+        # Parse JSON response (remove markdown code blocks if present)
+        try:
+            # Cheap literal scan before parsing: keep only the JSON object,
+            # which also drops any markdown code fence around it
+            start = response_text.find('{')
+            end = response_text.rfind('}')
+            if start == -1 or end < start:
+                print("  No JSON object in Gemini response")
+                print(f"  Raw response: {response_text}")
                 return None
 
-        except subprocess.TimeoutExpired:
-            print("  Gemini command timed out")
+            gemini_data = json.loads(response_text[start:end + 1])
+            print(f"  Gemini response: {gemini_data}")
+            return self._convert_gemini_goalies(gemini_data)
+
+        except (json.JSONDecodeError, AttributeError) as e:
+            print(f"  Failed to parse Gemini JSON response: {e}")
+            print(f"  Raw response: {response_text}")
             return None
-        except Exception as e:
-            print(f"  Error calling Gemini: {e}")
+
+    def _extract_goalies_batch_with_gemini(self, pdf_paths):
+        """
+        Extract starting goalies from several PDFs in one Gemini call
+        Returns a list of results in PDF order, or None if the response can't be mapped back
+        """
+        prompt = (
+            f"extrait moi les gardiens partant de chacun des {len(pdf_paths)} pdf suivants "
+            "(à noter que le gardien partant possède un * à coté de son nom). "
+            "donne seulement ta réponse dans le format json : un tableau contenant un objet par pdf, "
+            "dans le même ordre que les pdf. chaque objet devra respecter le format suivant en exemple : "
+            '{"visiteurs": {"equipe": "COLLEGE FRANCAIS RIVE-SUD", "gardien_partant": "LUCAS LESSARD"}, '
+            '"locaux": {"equipe": "LIONS LAC ST-LOUIS", "gardien_partant": "BRENDAN BOILY"}}'
+        )
+
+        response_text = self._run_gemini(prompt, pdf_paths, timeout=60 * len(pdf_paths))
+        if response_text is None:
+            return None
+
+        # Keep only the JSON array, which also drops any markdown code fence around it
+        start = response_text.find('[')
+        end = response_text.rfind(']')
+        if start == -1 or end < start:
+            print("  No JSON array in Gemini response")
             return None
 
+        try:
+            gemini_data = json.loads(response_text[start:end + 1])
+        except json.JSONDecodeError as e:
+            print(f"  Failed to parse Gemini JSON response: {e}")
+            return None
+
+        # Results are matched to PDFs by position, so the count must line up
+        if not isinstance(gemini_data, list) or len(gemini_data) != len(pdf_paths):
+            print(f"  Gemini returned {len(gemini_data) if isinstance(gemini_data, list) else 0} "
+                  f"results for {len(pdf_paths)} gamesheets")
+            return None
+
+        results = []
+        for pdf_path, gamesheet_data in zip(pdf_paths, gemini_data):
+            print(f"  Gemini response for {os.path.basename(pdf_path)}: {gamesheet_data}")
+            results.append(self._convert_gemini_goalies(gamesheet_data) if isinstance(gamesheet_data, dict) else None)
+        return results
 
     def parse_all_gamesheets(self, limit=None):
         """Parse all PDF gamesheets and add starting goalie information to game JSON files"""
@@ -171,21 +410,35 @@ class StartingGoalieParser:
             print(f"Directory {self.game_dir} not found - skipping goalie parsing")
             return False
 
-        pdf_files = [f for f in os.listdir(self.gamesheet_dir) if f.endswith('.pdf')]
+        with os.scandir(self.gamesheet_dir) as it:
+            pdf_entries = sorted(
+                (entry for entry in it if entry.name.endswith('.pdf') and entry.is_file()),
+                key=lambda entry: entry.name
+            )
         if limit:
-            pdf_files = pdf_files[:limit]
-            print(f"Found {len(pdf_files)} PDF gamesheets (limited to {limit} for testing)")
+            pdf_entries = pdf_entries[:limit]
+            print(f"Found {len(pdf_entries)} PDF gamesheets (limited to {limit} for testing)")
         else:
-            print(f"Found {len(pdf_files)} PDF gamesheets")
+            print(f"Found {len(pdf_entries)} PDF gamesheets")
 
         self.processed_count = 0
         self.skipped_count = 0
+        self.load_parse_cache()
+        pending = []
 
-        for pdf_file in sorted(pdf_files):
-            pdf_path = os.path.join(self.gamesheet_dir, pdf_file)
+        # Index game files named game_<id>_*.json once instead of listing game_dir per PDF
+        game_files = {}
+        for filename in os.listdir(self.game_dir):
+            game_file_match = self._GAME_FILE_PATTERN.match(filename)
+            if game_file_match and filename.endswith('.json'):
+                game_files.setdefault(game_file_match.group(1), os.path.join(self.game_dir, filename))
+
+        for entry in pdf_entries:
+            pdf_file = entry.name
+            pdf_path = entry.path
 
             # Extract game ID from filename
-            game_id_match = re.search(r'game_(\d+)', pdf_file)
+            game_id_match = self._GAME_ID_PATTERN.search(pdf_file)
             if not game_id_match:
                 print(f"Processing: {pdf_file}")
                 print(f"  Could not extract game ID from {pdf_file}")
@@ -193,11 +446,7 @@ class StartingGoalieParser:
 
             game_id = game_id_match.group(1)
             # Look for game file with full filename pattern
-            game_files = [f for f in os.listdir(self.game_dir) if f.startswith(f"game_{game_id}_") and f.endswith('.json')]
-            if game_files:
-                game_file = os.path.join(self.game_dir, game_files[0])
-            else:
-                game_file = os.path.join(self.game_dir, f"game_{game_id}.json")
+            game_file = game_files.get(game_id) or os.path.join(self.game_dir, f"game_{game_id}.json")
 
             # Check if corresponding game file exists
             if not os.path.exists(game_file):
@@ -222,9 +471,47 @@ class StartingGoalieParser:
                 self.skipped_count += 1
                 continue
 
-            # Parse the gamesheet
-            result = self.parse_gamesheet(pdf_path)
+            # PDFs of completed games never change, so a cached parse of the
+            # same file (same size and mtime) is reused instead of calling Gemini
+            stat = entry.stat()
+            cache_key = f"{game_id}:{stat.st_mtime:.0f}:{stat.st_size}"
+            pending.append((pdf_file, game_file, game_data, cache_key))
+
+        to_parse = [item for item in pending if item[3] not in self.parse_cache]
+        if len(to_parse) < len(pending):
+            print(f"Reusing cached parse results for {len(pending) - len(to_parse)} gamesheets")
+
+        # Gamesheets are sent to Gemini in batches to amortize process startup,
+        # and each batch is an independent subprocess, so run them concurrently
+        pdf_paths = [os.path.join(self.gamesheet_dir, item[0]) for item in to_parse]
+        game_teams = [
+            tuple(name if isinstance(name, str) else '' for name in (item[2].get('home_team'), item[2].get('away_team')))
+            for item in to_parse
+        ]
+        batch_starts = range(0, len(pdf_paths), self.batch_size)
+        batches = [pdf_paths[i:i + self.batch_size] for i in batch_starts]
+        team_batches = [game_teams[i:i + self.batch_size] for i in batch_starts]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.parse_gamesheet_batch, batch, teams)
+                       for batch, teams in zip(batches, team_batches)]
+
+            # A failed batch only loses its own gamesheets, not the other batches or the cache
+            results = []
+            for batch, future in zip(batches, futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    print(f"  Error parsing gamesheet batch: {e}")
+                    results.extend([None] * len(batch))
+        parsed = dict(zip((item[3] for item in to_parse), results))
+
+        for pdf_file, game_file, game_data, cache_key in pending:
+            print(f"Parsed: {pdf_file}")
+
+            result = self.parse_cache.get(cache_key) or parsed.get(cache_key)
             if result and result['count'] > 0:
+                self.parse_cache[cache_key] = result
+
                 # Add starting goalies to game data
                 game_data['starting_goalies'] = {
                     'home_goalie': None,
@@ -248,6 +535,8 @@ class StartingGoalieParser:
             else:
                 print("  No starting goalies found")
 
+        self.save_parse_cache()
+
         print(f"\nProcessing summary: {self.processed_count} new, {self.skipped_count} already processed")
         return True
 
@@ -256,91 +545,130 @@ class StartingGoalieParser:
 # HOCKEY STATISTICS COMPILER
 # ============================================================================
 
+@dataclass(slots=True)
+class TeamStats:
+    """Accumulated statistics for one team"""
+    id: int
+    name: str
+    games_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    goal_differential: int = 0
+    penalty_minutes: int = 0
+    powerplay_goals_for: int = 0
+    powerplay_goals_against: int = 0
+    powerplay_opportunities: int = 0
+    shorthanded_goals_for: int = 0
+    shorthanded_goals_against: int = 0
+    home_wins: int = 0
+    home_losses: int = 0
+    home_ties: int = 0
+    away_wins: int = 0
+    away_losses: int = 0
+    away_ties: int = 0
+    logo_url: str = None
+    local_logo: str = None
+
+    def to_dict(self):
+        """JSON-ready dict (local_logo only present once a logo file exists)"""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        if data['local_logo'] is None:
+            del data['local_logo']
+        return data
+
+
+@dataclass(slots=True)
+class PlayerStats:
+    """Accumulated statistics for one player (skater or goalie)"""
+    id: int
+    name: str
+    team_id: int
+    position: str
+    games_played: int = 0
+    goals: int = 0
+    assists: int = 0
+    points: int = 0
+    penalty_minutes: int = 0
+    powerplay_goals: int = 0
+    powerplay_assists: int = 0
+    shorthanded_goals: int = 0
+    shorthanded_assists: int = 0
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    goals_against: int = 0
+
+    def to_dict(self):
+        """JSON-ready dict"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
 class HockeyStatsCompiler:
     """Processes JSON game files to compile team and player statistics"""
 
-    def __init__(self, games_dir, web_dir):
+    # Roster position -> index position (anything else counts as a forward)
+    POSITION_MAP = {
+        'F': 'F',
+        'C': 'F',
+        'D': 'D',
+        'G': 'G',
+        'Trainer': 'Coach',
+        'Assistant Coach': 'Coach',
+        'Head Coach': 'Coach',
+        'Safety Person': 'Coach',
+        'Goaltending Coach': 'Coach'
+    }
+
+    def __init__(self, games_dir, web_dir, skip_logos=False):
         self.games_dir = games_dir
         self.web_dir = web_dir
+        self.skip_logos = skip_logos
         self.teams = {}
         self.players = {}
         self.games = []
         self.team_logos = {}
         self.player_positions = {}
         self.starting_goalies = {}
+        self.heuristic_starters = {}
 
     def load_games(self):
         """Load all JSON game files"""
         print("Loading game files...")
-        game_files = [f for f in os.listdir(self.games_dir) if f.endswith('.json')]
+        with os.scandir(self.games_dir) as it:
+            game_entries = sorted(
+                (entry for entry in it if entry.name.endswith('.json') and entry.is_file()),
+                key=lambda entry: entry.name
+            )
 
-        for filename in sorted(game_files):
-            file_path = os.path.join(self.games_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    game_data = json.load(f)
+        # File reads release the GIL, so reads overlap across threads (decoding still holds it)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(read_game_file, [entry.path for entry in game_entries])
 
-                if game_data.get('status') == 'FINAL' and 'boxscore' in game_data:
+            for entry, (game_data, error) in zip(game_entries, results):
+                filename = entry.name
+                if error is not None:
+                    print(f"  Error loading {filename}: {error}")
+                elif game_data is not None and game_data.get('status') == 'FINAL' and 'boxscore' in game_data:
                     self.games.append(game_data)
                     print(f"  Loaded: {filename}")
                 else:
                     print(f"  Skipped (not final): {filename}")
-            except Exception as e:
-                print(f"  Error loading {filename}: {e}")
 
         print(f"Total games loaded: {len(self.games)}")
 
     def initialize_team_stats(self, team_id, team_name):
         """Initialize team statistics structure"""
         if team_id not in self.teams:
-            self.teams[team_id] = {
-                'id': team_id,
-                'name': team_name,
-                'games_played': 0,
-                'wins': 0,
-                'losses': 0,
-                'ties': 0,
-                'points': 0,
-                'goals_for': 0,
-                'goals_against': 0,
-                'goal_differential': 0,
-                'penalty_minutes': 0,
-                'powerplay_goals_for': 0,
-                'powerplay_goals_against': 0,
-                'powerplay_opportunities': 0,
-                'shorthanded_goals_for': 0,
-                'shorthanded_goals_against': 0,
-                'home_wins': 0,
-                'home_losses': 0,
-                'home_ties': 0,
-                'away_wins': 0,
-                'away_losses': 0,
-                'away_ties': 0,
-                'logo_url': None
-            }
+            self.teams[team_id] = TeamStats(id=team_id, name=team_name)
 
     def initialize_player_stats(self, player_id, player_name, team_id, position):
         """Initialize player statistics structure"""
         if player_id not in self.players:
-            self.players[player_id] = {
-                'id': player_id,
-                'name': player_name,
-                'team_id': team_id,
-                'position': position,
-                'games_played': 0,
-                'goals': 0,
-                'assists': 0,
-                'points': 0,
-                'penalty_minutes': 0,
-                'powerplay_goals': 0,
-                'powerplay_assists': 0,
-                'shorthanded_goals': 0,
-                'shorthanded_assists': 0,
-                'wins': 0,
-                'losses': 0,
-                'ties': 0,
-                'goals_against': 0
-            }
+            self.players[player_id] = PlayerStats(id=player_id, name=player_name, team_id=team_id, position=position)
 
     def build_player_positions_index(self):
         """Build a global index of player positions from all rosters"""
@@ -354,16 +682,7 @@ class HockeyStatsCompiler:
                         continue
                     positions = player.get('positions', ['F'])
                     position = positions[0] if positions else 'F'
-
-                    # Handle different position types
-                    if position == 'C':
-                        position = 'F'
-                    elif position in ['Trainer', 'Assistant Coach', 'Head Coach', 'Safety Person', 'Goaltending Coach']:
-                        position = 'Coach'
-                    elif position not in ['G', 'D', 'F']:
-                        position = 'F'
-
-                    self.player_positions[player_id] = position
+                    self.player_positions[player_id] = self.POSITION_MAP.get(position, 'F')
 
         print(f"Built position index for {len(self.player_positions)} players")
 
@@ -373,7 +692,7 @@ class HockeyStatsCompiler:
 
         for game in self.games:
             if 'starting_goalies' in game and game['starting_goalies'] is not None:
-                game_id = game['id']
+                game_id = self.game_key(game['id'])
                 starting_names = []
 
                 # Handle both old and new formats
@@ -393,30 +712,37 @@ class HockeyStatsCompiler:
                             starting_names.append(goalie['name'])
 
                 if starting_names:
-                    self.starting_goalies[game_id] = starting_names
+                    # Stored pre-normalized so lookups are a set membership test
+                    self.starting_goalies[game_id] = frozenset(self.normalize_name(name) for name in starting_names)
                     games_with_starting_goalies += 1
 
         print(f"Loaded starting goalie data for {games_with_starting_goalies} games")
 
-    def normalize_name(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def normalize_name(name):
         """Normalize player name for comparison (remove accents, etc.)"""
-        import unicodedata
-        normalized = unicodedata.normalize('NFD', name)
-        ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+        ascii_name = name.translate(ACCENT_TABLE)
+
+        # Anything the table doesn't cover goes through NFD decomposition
+        if not ascii_name.isascii():
+            normalized = unicodedata.normalize('NFD', ascii_name)
+            ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
         return ascii_name.upper().strip()
 
+    @staticmethod
+    def game_key(game_id):
+        """Normalize a game id so string and integer ids share one key"""
+        if isinstance(game_id, str) and game_id.isdigit():
+            return int(game_id)
+        return game_id
+
     def is_starting_goalie(self, game_id, player_name, team_id=None, game_data=None):
         """Check if a goalie was a starter in the given game"""
         # If we have starting goalie data for this game, use it
-        if game_id in self.starting_goalies:
-            starting_names = self.starting_goalies[game_id]
-            normalized_player_name = self.normalize_name(player_name)
-
-            # Check if this player matches any starting goalie
-            for starting_name in starting_names:
-                if self.normalize_name(starting_name) == normalized_player_name:
-                    return True
-            return False
+        starters = self.starting_goalies.get(self.game_key(game_id))
+        if starters is not None:
+            return self.normalize_name(player_name) in starters
 
         # Fallback: if no starting goalie data available, use heuristic
         # Assume the first goalie in the roster is the starter
@@ -429,15 +755,26 @@ class HockeyStatsCompiler:
 
     def _is_likely_starting_goalie(self, player_name, team_id, game_data):
         """Heuristic to determine likely starting goalie from roster"""
-        # Get the team's roster
-        home_team = game_data.get('boxscore', {}).get('teams', [])[0] if len(game_data.get('boxscore', {}).get('teams', [])) > 0 else None
-        away_team = game_data.get('boxscore', {}).get('teams', [])[1] if len(game_data.get('boxscore', {}).get('teams', [])) > 1 else None
+        # Resolved once per game and team, then reused for each goalie on that roster
+        cache_key = (game_data.get('id'), team_id)
+        if cache_key not in self.heuristic_starters:
+            self.heuristic_starters[cache_key] = self._likely_starting_goalies(team_id, game_data)
+
+        starters = self.heuristic_starters[cache_key]
+        return starters is None or player_name in starters
 
-        if not home_team or not away_team:
-            return True
+    def _likely_starting_goalies(self, team_id, game_data):
+        """
+        Names of the likely starting goalies in a team's roster,
+        or None when the roster can't tell (every goalie is then treated as a starter)
+        """
+        # Get the team's roster
+        teams = game_data.get('boxscore', {}).get('teams', [])
+        if len(teams) < 2 or not teams[0] or not teams[1]:
+            return None
 
         # Determine which roster to check
-        roster_key = 'home_team_roster' if team_id == home_team.get('id') else 'away_team_roster'
+        roster_key = 'home_team_roster' if team_id == teams[0].get('id') else 'away_team_roster'
         roster = game_data.get(roster_key, [])
 
         # Find all goalies in the roster
@@ -447,10 +784,10 @@ class HockeyStatsCompiler:
             if 'G' in player_positions:
                 participant = player.get('participant', {})
                 player_id = player.get('participantId')
-                player_name = participant.get('fullName')
+                goalie_name = participant.get('fullName')
 
                 # Skip if missing essential data
-                if not player_id or not player_name:
+                if not player_id or not goalie_name:
                     continue
 
                 number = player.get('number')
@@ -458,17 +795,17 @@ class HockeyStatsCompiler:
                 if number is None or number == 0:
                     number = 999  # Put at end
                 goalies.append({
-                    'name': player_name,
+                    'name': goalie_name,
                     'id': player_id,
                     'number': number
                 })
 
         if not goalies:
-            return True
+            return None
 
         # If there's only one goalie, they're the starter
         if len(goalies) == 1:
-            return goalies[0]['name'] == player_name
+            return {goalies[0]['name']}
 
         # Sort by jersey number (lower valid numbers typically start)
         # Put goalies with valid numbers first, then invalid ones
@@ -486,21 +823,32 @@ class HockeyStatsCompiler:
         valid_goalies = [g for g in goalies if g['number'] != 999]
         if valid_goalies:
             # First goalie with valid number is starter
-            return valid_goalies[0]['name'] == player_name
+            return {valid_goalies[0]['name']}
         else:
             # No valid numbers, first two goalies might be starters
-            return goalies.index(next((g for g in goalies if g['name'] == player_name), None)) < 2 if any(g['name'] == player_name for g in goalies) else False
-
-    def get_player_position(self, boxscore, player_id):
-        """Get player position from global index or current roster"""
-        if player_id in self.player_positions:
-            return self.player_positions[player_id]
+            return {g['name'] for g in goalies[:2]}
 
+    def build_game_positions(self, boxscore):
+        """
+        Build the position lookup for one game: the global index, plus boxscore
+        roster players missing from it (centers folded into forwards)
+        """
+        extra_positions = {}
         for player in boxscore.get('roster', []):
-            if player.get('participantId') == player_id:
-                positions = player.get('positions', ['F'])
-                return positions[0] if positions else 'F'
-        return 'F'
+            player_id = player.get('participantId')
+            if player_id in self.player_positions or player_id in extra_positions:
+                continue
+            positions = player.get('positions', ['F'])
+            position = positions[0] if positions else 'F'
+            extra_positions[player_id] = 'F' if position == 'C' else position
+
+        # The global index already has 'C' folded into 'F'; share it when nothing is added
+        if not extra_positions:
+            return self.player_positions
+
+        game_positions = dict(self.player_positions)
+        game_positions.update(extra_positions)
+        return game_positions
 
     def calculate_powerplay_opportunities(self, game, home_team_id, away_team_id):
         """
@@ -514,9 +862,17 @@ class HockeyStatsCompiler:
         if not penalties:
             return {home_team_id: 0, away_team_id: 0}
 
-        # Convert penalties to events with start and end times
+        # Convert penalties to (time, side, delta) events: side 0 is home, 1 is away
         penalty_events = []
         for penalty in penalties:
+            team_id = penalty.get('teamId')
+            if team_id == home_team_id:
+                side = 0
+            elif team_id == away_team_id:
+                side = 1
+            else:
+                continue
+
             game_time = penalty.get('gameTime', {})
             period = int(game_time.get('period', 1))
             minutes = int(game_time.get('minutes', 0))
@@ -527,53 +883,30 @@ class HockeyStatsCompiler:
 
             # Get penalty duration in seconds
             duration_name = penalty.get('duration', {}).get('name', 'Minor')
-            if 'Minor' in duration_name or 'Mineure' in duration_name:
-                duration = 120  # 2 minutes
-            elif 'Major' in duration_name or 'Majeure' in duration_name:
-                duration = 300  # 5 minutes
-            elif 'Misconduct' in duration_name:
-                duration = 600  # 10 minutes
-            else:
-                duration = 120  # Default to 2 minutes
+            duration = penalty_minutes(duration_name) * 60
 
-            end_time = start_time + duration
-            team_id = penalty.get('teamId')
-
-            if team_id:
-                penalty_events.append({
-                    'team_id': team_id,
-                    'start': start_time,
-                    'end': end_time
-                })
+            penalty_events.append((start_time, side, 1))
+            penalty_events.append((start_time + duration, side, -1))
 
         # Track PP opportunities
         pp_opportunities = {home_team_id: 0, away_team_id: 0}
 
-        # Sort all time points (starts and ends of penalties)
-        time_points = set()
-        for event in penalty_events:
-            time_points.add(event['start'])
-            time_points.add(event['end'])
-
-        time_points = sorted(time_points)
+        # Sweep the events in time order, keeping a count of active penalties per side
+        penalty_events.sort(key=itemgetter(0))
+        active_penalties = [0, 0]
 
         # Track previous PP state
         prev_home_pp = False
         prev_away_pp = False
 
-        # For each time segment, check PP state
-        for i in range(len(time_points) - 1):
-            current_time = time_points[i]
-
-            # Count active penalties for each team at this time
-            home_penalties = sum(1 for p in penalty_events
-                               if p['team_id'] == home_team_id and p['start'] <= current_time < p['end'])
-            away_penalties = sum(1 for p in penalty_events
-                               if p['team_id'] == away_team_id and p['start'] <= current_time < p['end'])
+        for _, events in groupby(penalty_events, key=itemgetter(0)):
+            # A penalty is active from its start up to (not including) its end
+            for _, side, delta in events:
+                active_penalties[side] += delta
 
             # Determine PP state
-            home_has_pp = away_penalties > home_penalties
-            away_has_pp = home_penalties > away_penalties
+            home_has_pp = active_penalties[1] > active_penalties[0]
+            away_has_pp = active_penalties[0] > active_penalties[1]
 
             # Count new PP opportunities (transition from no PP to PP)
             if home_has_pp and not prev_home_pp:
@@ -593,13 +926,17 @@ class HockeyStatsCompiler:
         self.build_player_positions_index()
         self.load_starting_goalies()
 
-        player_games = {}
+        # Games appeared in per player, and games started per goalie
+        player_games = defaultdict(int)
+        goalie_starts = defaultdict(int)
 
         for game in self.games:
             if 'boxscore' not in game:
                 continue
 
             boxscore = game['boxscore']
+            game_positions = self.build_game_positions(boxscore)
+            seen_players = set()
             home_score = game.get('home_score', 0)
             away_score = game.get('away_score', 0)
 
@@ -624,44 +961,49 @@ class HockeyStatsCompiler:
             self.initialize_team_stats(home_team_id, home_team_name)
             self.initialize_team_stats(away_team_id, away_team_name)
 
-            self.teams[home_team_id]['logo_url'] = home_team.get('logoUrl')
-            self.teams[away_team_id]['logo_url'] = away_team.get('logoUrl')
+            home_stats = self.teams[home_team_id]
+            away_stats = self.teams[away_team_id]
+
+            home_stats.logo_url = home_team.get('logoUrl')
+            away_stats.logo_url = away_team.get('logoUrl')
 
             # Update games played
-            self.teams[home_team_id]['games_played'] += 1
-            self.teams[away_team_id]['games_played'] += 1
+            home_stats.games_played += 1
+            away_stats.games_played += 1
 
             # Calculate and update PP opportunities
             pp_opps = self.calculate_powerplay_opportunities(game, home_team_id, away_team_id)
-            self.teams[home_team_id]['powerplay_opportunities'] += pp_opps.get(home_team_id, 0)
-            self.teams[away_team_id]['powerplay_opportunities'] += pp_opps.get(away_team_id, 0)
+            home_stats.powerplay_opportunities += pp_opps.get(home_team_id, 0)
+            away_stats.powerplay_opportunities += pp_opps.get(away_team_id, 0)
 
             # Update goals
-            self.teams[home_team_id]['goals_for'] += home_score
-            self.teams[home_team_id]['goals_against'] += away_score
-            self.teams[away_team_id]['goals_for'] += away_score
-            self.teams[away_team_id]['goals_against'] += home_score
+            home_stats.goals_for += home_score
+            home_stats.goals_against += away_score
+            away_stats.goals_for += away_score
+            away_stats.goals_against += home_score
+            home_stats.goal_differential += home_score - away_score
+            away_stats.goal_differential += away_score - home_score
 
             # Determine outcome
             if home_score > away_score:
-                self.teams[home_team_id]['wins'] += 1
-                self.teams[home_team_id]['home_wins'] += 1
-                self.teams[home_team_id]['points'] += 2
-                self.teams[away_team_id]['losses'] += 1
-                self.teams[away_team_id]['away_losses'] += 1
+                home_stats.wins += 1
+                home_stats.home_wins += 1
+                home_stats.points += 2
+                away_stats.losses += 1
+                away_stats.away_losses += 1
             elif away_score > home_score:
-                self.teams[away_team_id]['wins'] += 1
-                self.teams[away_team_id]['away_wins'] += 1
-                self.teams[away_team_id]['points'] += 2
-                self.teams[home_team_id]['losses'] += 1
-                self.teams[home_team_id]['home_losses'] += 1
+                away_stats.wins += 1
+                away_stats.away_wins += 1
+                away_stats.points += 2
+                home_stats.losses += 1
+                home_stats.home_losses += 1
             else:
-                self.teams[home_team_id]['ties'] += 1
-                self.teams[home_team_id]['home_ties'] += 1
-                self.teams[home_team_id]['points'] += 1
-                self.teams[away_team_id]['ties'] += 1
-                self.teams[away_team_id]['away_ties'] += 1
-                self.teams[away_team_id]['points'] += 1
+                home_stats.ties += 1
+                home_stats.home_ties += 1
+                home_stats.points += 1
+                away_stats.ties += 1
+                away_stats.away_ties += 1
+                away_stats.points += 1
 
             # Process goals
             for goal in boxscore.get('goals', []):
@@ -674,29 +1016,31 @@ class HockeyStatsCompiler:
                 if not scorer_id or not team_id:
                     continue
 
-                position = self.get_player_position(boxscore, scorer_id)
-                if position == 'C':
-                    position = 'F'
+                position = game_positions.get(scorer_id, 'F')
                 self.initialize_player_stats(scorer_id, scorer_name, team_id, position)
 
-                self.players[scorer_id]['goals'] += 1
-                self.players[scorer_id]['points'] += 1
+                scorer = self.players[scorer_id]
+                scorer.goals += 1
+                scorer.points += 1
+
+                seen_players.add(scorer_id)
+
+                is_powerplay = goal.get('isPowerplay')
+                is_shorthanded = goal.get('isShorthanded')
 
-                if scorer_id not in player_games:
-                    player_games[scorer_id] = set()
-                player_games[scorer_id].add(game['id'])
+                if is_powerplay or is_shorthanded:
+                    team_stats = self.teams[team_id]
+                    opponent_stats = away_stats if team_id == home_team_id else home_stats
 
-                if goal.get('isPowerplay'):
-                    self.players[scorer_id]['powerplay_goals'] += 1
-                    self.teams[team_id]['powerplay_goals_for'] += 1
-                    opponent_id = away_team_id if team_id == home_team_id else home_team_id
-                    self.teams[opponent_id]['powerplay_goals_against'] += 1
+                    if is_powerplay:
+                        scorer.powerplay_goals += 1
+                        team_stats.powerplay_goals_for += 1
+                        opponent_stats.powerplay_goals_against += 1
 
-                if goal.get('isShorthanded'):
-                    self.players[scorer_id]['shorthanded_goals'] += 1
-                    self.teams[team_id]['shorthanded_goals_for'] += 1
-                    opponent_id = away_team_id if team_id == home_team_id else home_team_id
-                    self.teams[opponent_id]['shorthanded_goals_against'] += 1
+                    if is_shorthanded:
+                        scorer.shorthanded_goals += 1
+                        team_stats.shorthanded_goals_for += 1
+                        opponent_stats.shorthanded_goals_against += 1
 
                 # Process assists
                 for assist in goal.get('assists', []):
@@ -707,24 +1051,23 @@ class HockeyStatsCompiler:
                     if not assist_id:
                         continue
 
-                    position = self.get_player_position(boxscore, assist_id)
-                    if position == 'C':
-                        position = 'F'
+                    position = game_positions.get(assist_id, 'F')
                     self.initialize_player_stats(assist_id, assist_name, team_id, position)
 
-                    self.players[assist_id]['assists'] += 1
-                    self.players[assist_id]['points'] += 1
+                    assister = self.players[assist_id]
+                    assister.assists += 1
+                    assister.points += 1
 
-                    if assist_id not in player_games:
-                        player_games[assist_id] = set()
-                    player_games[assist_id].add(game['id'])
+                    seen_players.add(assist_id)
 
-                    if goal.get('isPowerplay'):
-                        self.players[assist_id]['powerplay_assists'] += 1
-                    if goal.get('isShorthanded'):
-                        self.players[assist_id]['shorthanded_assists'] += 1
+                    if is_powerplay:
+                        assister.powerplay_assists += 1
+                    if is_shorthanded:
+                        assister.shorthanded_assists += 1
 
-            # Process penalties
+            # Process penalties (minutes are summed per game, then applied once per player/team)
+            player_pim = Counter()
+            team_pim = Counter()
             for penalty in boxscore.get('penalties', []):
                 participant = penalty.get('participant', {})
                 player_id = participant.get('participantId')
@@ -736,121 +1079,95 @@ class HockeyStatsCompiler:
                     continue
 
                 duration_name = penalty.get('duration', {}).get('name', '')
-                if 'Minor' in duration_name or 'Mineure' in duration_name:
-                    penalty_minutes = 2
-                elif 'Major' in duration_name or 'Majeure' in duration_name:
-                    penalty_minutes = 5
-                elif 'Misconduct' in duration_name:
-                    penalty_minutes = 10
-                else:
-                    penalty_minutes = 2
-
-                position = self.get_player_position(boxscore, player_id)
-                if position == 'C':
-                    position = 'F'
-                self.initialize_player_stats(player_id, player_name, team_id, position)
-
-                self.players[player_id]['penalty_minutes'] += penalty_minutes
-                self.teams[team_id]['penalty_minutes'] += penalty_minutes
-
-                if player_id not in player_games:
-                    player_games[player_id] = set()
-                player_games[player_id].add(game['id'])
-
-            # Process rosters for goalie stats
-            for player in game.get('home_team_roster', []):
-                participant = player.get('participant', {})
-                player_id = player.get('participantId')
-                player_name = participant.get('fullName')
-
-                # Skip if missing essential data
-                if not player_id or not player_name:
-                    continue
-
-                team_id = home_team_id
-                position = self.get_player_position(boxscore, player_id)
-
-                if position not in ['F', 'D', 'G', 'C']:
-                    continue
-
-                if position == 'C':
-                    position = 'F'
-
-                self.initialize_player_stats(player_id, player_name, team_id, position)
-
-                if player_id not in player_games:
-                    player_games[player_id] = set()
-                player_games[player_id].add(game['id'])
-
-                if position == 'G' and self.is_starting_goalie(game['id'], player_name, team_id, game):
-                    if home_score > away_score:
-                        self.players[player_id]['wins'] += 1
-                    elif home_score < away_score:
-                        self.players[player_id]['losses'] += 1
-                    else:
-                        self.players[player_id]['ties'] += 1
-                    self.players[player_id]['goals_against'] += away_score
+                minutes = penalty_minutes(duration_name)
+
+                if player_id not in player_pim:
+                    position = game_positions.get(player_id, 'F')
+                    self.initialize_player_stats(player_id, player_name, team_id, position)
+                    seen_players.add(player_id)
+
+                player_pim[player_id] += minutes
+                team_pim[team_id] += minutes
+
+            for player_id, minutes in player_pim.items():
+                self.players[player_id].penalty_minutes += minutes
+            for team_id, minutes in team_pim.items():
+                self.teams[team_id].penalty_minutes += minutes
+
+            # Process both rosters for games played and goalie stats
+            for roster_key, team_id, own_score, opp_score in (
+                ('home_team_roster', home_team_id, home_score, away_score),
+                ('away_team_roster', away_team_id, away_score, home_score)
+            ):
+                for player in game.get(roster_key, []):
+                    participant = player.get('participant', {})
+                    player_id = player.get('participantId')
+                    player_name = participant.get('fullName')
 
-            for player in game.get('away_team_roster', []):
-                participant = player.get('participant', {})
-                player_id = player.get('participantId')
-                player_name = participant.get('fullName')
+                    # Skip if missing essential data
+                    if not player_id or not player_name:
+                        continue
 
-                # Skip if missing essential data
-                if not player_id or not player_name:
-                    continue
+                    position = game_positions.get(player_id, 'F')
 
-                team_id = away_team_id
-                position = self.get_player_position(boxscore, player_id)
+                    if position not in ('F', 'D', 'G'):
+                        continue
 
-                if position not in ['F', 'D', 'G', 'C']:
-                    continue
+                    self.initialize_player_stats(player_id, player_name, team_id, position)
+
+                    seen_players.add(player_id)
+
+                    if position == 'G' and self.is_starting_goalie(game['id'], player_name, team_id, game):
+                        goalie = self.players[player_id]
+                        goalie_starts[player_id] += 1
+                        if own_score > opp_score:
+                            goalie.wins += 1
+                        elif own_score < opp_score:
+                            goalie.losses += 1
+                        else:
+                            goalie.ties += 1
+                        goalie.goals_against += opp_score
+
+            for player_id in seen_players:
+                player_games[player_id] += 1
+
+        # Update games_played (goalies are credited with the games they started)
+        players = self.players
+        for player_id, games_count in player_games.items():
+            player = players.get(player_id)
+            if player is None:
+                continue
+            if player.position == 'G':
+                player.games_played = goalie_starts[player_id]
+            else:
+                player.games_played = games_count
 
-                if position == 'C':
-                    position = 'F'
+        print(f"Processed {len(self.teams)} teams and {len(self.players)} players")
 
-                self.initialize_player_stats(player_id, player_name, team_id, position)
-
-                if player_id not in player_games:
-                    player_games[player_id] = set()
-                player_games[player_id].add(game['id'])
-
-                if position == 'G' and self.is_starting_goalie(game['id'], player_name, team_id, game):
-                    if away_score > home_score:
-                        self.players[player_id]['wins'] += 1
-                    elif away_score < home_score:
-                        self.players[player_id]['losses'] += 1
-                    else:
-                        self.players[player_id]['ties'] += 1
-                    self.players[player_id]['goals_against'] += home_score
-
-        # Update games_played
-        for player_id, game_set in player_games.items():
-            if player_id in self.players:
-                if self.players[player_id]['position'] == 'G':
-                    started_games = 0
-                    player_name = self.players[player_id]['name']
-                    team_id = self.players[player_id]['team_id']
-
-                    for game_id in game_set:
-                        # Find the game data for this game_id
-                        game_data = None
-                        for game in self.games:
-                            if game['id'] == game_id:
-                                game_data = game
-                                break
-
-                        if self.is_starting_goalie(game_id, player_name, team_id, game_data):
-                            started_games += 1
-                    self.players[player_id]['games_played'] = started_games
-                else:
-                    self.players[player_id]['games_played'] = len(game_set)
+    def _download_logo(self, session, logo_url, filepath, validators=None):
+        """
+        Download a single logo to filepath, revalidating with the saved ETag/Last-Modified.
+        Returns the response validators, or None when the server reports the logo unchanged.
+        """
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        response = session.get(logo_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
 
-        # Calculate goal differentials
-        for team in self.teams.values():
-            team['goal_differential'] = team['goals_for'] - team['goals_against']
+        with open(filepath, 'wb') as f:
+            f.write(response.content)
 
-        print(f"Processed {len(self.teams)} teams and {len(self.players)} players")
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
 
     def download_team_logos(self):
         """Download team logos to assets folder"""
@@ -858,43 +1175,87 @@ class HockeyStatsCompiler:
         logos_dir = os.path.join(self.web_dir, 'assets', 'logos')
         os.makedirs(logos_dir, exist_ok=True)
 
+        # ETag/Last-Modified of previously downloaded logos, keyed by filename
+        validators_file = os.path.join(logos_dir, '.etags.json')
+        try:
+            with open(validators_file, 'rb') as f:
+                logo_validators = json_loads(f.read())
+        except (OSError, ValueError):
+            logo_validators = {}
+
         downloaded_count = 0
+        unchanged_count = 0
         skipped_count = 0
+        to_download = []
 
         for team_id, logo_url in self.team_logos.items():
             if not logo_url:
                 continue
 
-            try:
-                parsed_url = urllib.parse.urlparse(logo_url)
-                file_ext = os.path.splitext(parsed_url.path)[1] or '.png'
-                filename = f"team_{team_id}{file_ext}"
-                filepath = os.path.join(logos_dir, filename)
+            parsed_url = urllib.parse.urlparse(logo_url)
+            file_ext = os.path.splitext(parsed_url.path)[1] or '.png'
+            filename = f"team_{team_id}{file_ext}"
+            filepath = os.path.join(logos_dir, filename)
 
-                # Check if logo already exists
-                if os.path.exists(filepath):
-                    if team_id in self.teams:
-                        self.teams[team_id]['local_logo'] = f"assets/logos/{filename}"
+            # Existing logos are kept unless we have validators to cheaply revalidate them
+            validators = None
+            if os.path.exists(filepath):
+                if team_id in self.teams:
+                    self.teams[team_id].local_logo = f"assets/logos/{filename}"
+                validators = logo_validators.get(filename)
+                if not validators:
                     print(f"  Logo already exists for team {team_id}")
                     skipped_count += 1
                     continue
 
-                response = requests.get(logo_url, timeout=10)
-                response.raise_for_status()
+            to_download.append((team_id, logo_url, filename, filepath, validators))
 
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
+        if to_download and self.skip_logos:
+            # Logos already on disk stay linked above; nothing is fetched or revalidated
+            print(f"  Skipped {len(to_download)} logo downloads as requested")
+            to_download = []
 
-                if team_id in self.teams:
-                    self.teams[team_id]['local_logo'] = f"assets/logos/{filename}"
+        if to_download:
+            # Download missing logos in parallel over one pooled session
+            with requests.Session() as session, ThreadPoolExecutor(max_workers=16) as executor:
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
 
-                print(f"  Downloaded logo for team {team_id}")
-                downloaded_count += 1
+                futures = [
+                    (team_id, filename, executor.submit(self._download_logo, session, logo_url, filepath, validators))
+                    for team_id, logo_url, filename, filepath, validators in to_download
+                ]
 
-            except Exception as e:
-                print(f"  Failed to download logo for team {team_id}: {e}")
+                for team_id, filename, future in futures:
+                    try:
+                        new_validators = future.result()
+                    except Exception as e:
+                        print(f"  Failed to download logo for team {team_id}: {e}")
+                        continue
+
+                    if new_validators is None:
+                        print(f"  Logo unchanged for team {team_id}")
+                        unchanged_count += 1
+                        continue
 
-        print(f"Logo download summary: {downloaded_count} downloaded, {skipped_count} already existed")
+                    if new_validators['etag'] or new_validators['last_modified']:
+                        logo_validators[filename] = new_validators
+
+                    if team_id in self.teams:
+                        self.teams[team_id].local_logo = f"assets/logos/{filename}"
+
+                    print(f"  Downloaded logo for team {team_id}")
+                    downloaded_count += 1
+
+            if downloaded_count:
+                try:
+                    write_json(validators_file, logo_validators)
+                except OSError as e:
+                    print(f"  Error saving logo validators: {e}")
+
+        print(f"Logo download summary: {downloaded_count} downloaded, {unchanged_count} unchanged, "
+              f"{skipped_count} already existed")
 
     def save_data(self):
         """Save compiled statistics to JSON files"""
@@ -903,25 +1264,21 @@ class HockeyStatsCompiler:
         data_dir = os.path.join(self.web_dir, 'data')
         os.makedirs(data_dir, exist_ok=True)
 
-        # Sort teams by points
-        teams_list = sorted(
-            self.teams.values(),
-            key=lambda x: (-x['points'], -x['goal_differential'], x['name'])
-        )
+        # Sort teams by points, goal differential, then name. Python's sort is
+        # stable (also with reverse=True), so sorting by name first and then by the
+        # numeric keys with C-level attrgetter keys gives the same order
+        teams_list = sorted(self.teams.values(), key=attrgetter('name'))
+        teams_list.sort(key=attrgetter('points', 'goal_differential'), reverse=True)
 
-        # Sort players by points
-        players_list = sorted(
-            self.players.values(),
-            key=lambda x: (-x['points'], -x['goals'], x['name'])
-        )
+        # Sort players by points, goals, then name
+        players_list = sorted(self.players.values(), key=attrgetter('name'))
+        players_list.sort(key=attrgetter('points', 'goals'), reverse=True)
 
         # Save teams
-        with open(os.path.join(data_dir, 'teams.json'), 'w', encoding='utf-8') as f:
-            json.dump(teams_list, f, indent=2, ensure_ascii=False)
+        write_json(os.path.join(data_dir, 'teams.json'), [team.to_dict() for team in teams_list])
 
         # Save players
-        with open(os.path.join(data_dir, 'players.json'), 'w', encoding='utf-8') as f:
-            json.dump(players_list, f, indent=2, ensure_ascii=False)
+        write_json(os.path.join(data_dir, 'players.json'), [player.to_dict() for player in players_list])
 
         # Save games
         games_summary = []
@@ -936,8 +1293,7 @@ class HockeyStatsCompiler:
                 'status': game['status']
             })
 
-        with open(os.path.join(data_dir, 'games.json'), 'w', encoding='utf-8') as f:
-            json.dump(games_summary, f, indent=2, ensure_ascii=False)
+        write_json(os.path.join(data_dir, 'games.json'), games_summary)
 
         print(f"Saved data files to {data_dir}")
         print(f"\nSummary:")
@@ -946,10 +1302,10 @@ class HockeyStatsCompiler:
         print(f"  Games: {len(games_summary)}")
 
         if teams_list:
-            print(f"\nTop team: {teams_list[0]['name']} ({teams_list[0]['points']} pts)")
+            print(f"\nTop team: {teams_list[0].name} ({teams_list[0].points} pts)")
 
         if players_list:
-            print(f"Top scorer: {players_list[0]['name']} ({players_list[0]['points']} pts)")
+            print(f"Top scorer: {players_list[0].name} ({players_list[0].points} pts)")
 
     def compile_all(self):
         """Run the complete compilation process"""
@@ -966,30 +1322,36 @@ class HockeyStatsCompiler:
 class DivisionAssigner:
     """Assigns teams to divisions using fuzzy string matching"""
 
+    # Short team names -> full names used in divisions.json (a match replaces the whole name)
+    TEAM_NAME_REPLACEMENTS = {
+        'grenadiers lac st-louis': 'grenadiers du lac st-louis',
+        'lions lac st-louis': 'lions du lac st-louis',
+        'citadelles rouyn-noranda': 'citadelles de rouyn-noranda',
+        'seigneurs mille-îles': 'seigneurs des mille-îles',
+        'conquérants basses-laurentides': 'conquérants basses-laurentides',
+        'forestiers abitibi-témiscaming': 'forestiers abitibi-témiscaming',
+    }
+    TEAM_NAME_PATTERN = re.compile('|'.join(re.escape(old) for old in TEAM_NAME_REPLACEMENTS))
+
     def __init__(self, web_dir):
         self.web_dir = web_dir
 
-    def similarity(self, a, b):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def similarity(a, b):
         """Calculate similarity between two strings"""
         return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
-    def normalize_team_name(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def normalize_team_name(name):
         """Normalize team name for better matching"""
         name = name.lower()
 
-        replacements = {
-            'grenadiers lac st-louis': 'grenadiers du lac st-louis',
-            'lions lac st-louis': 'lions du lac st-louis',
-            'citadelles rouyn-noranda': 'citadelles de rouyn-noranda',
-            'seigneurs mille-îles': 'seigneurs des mille-îles',
-            'conquérants basses-laurentides': 'conquérants basses-laurentides',
-            'forestiers abitibi-témiscaming': 'forestiers abitibi-témiscaming',
-        }
-
-        for old, new in replacements.items():
-            if old in name:
-                name = new
-                break
+        # One regex scan for all short names instead of a substring test per name
+        match = DivisionAssigner.TEAM_NAME_PATTERN.search(name)
+        if match:
+            name = DivisionAssigner.TEAM_NAME_REPLACEMENTS[match.group(0)]
 
         return name
 
@@ -1000,55 +1362,91 @@ class DivisionAssigner:
         teams_file = os.path.join(self.web_dir, 'data', 'teams.json')
         divisions_file = os.path.join(self.web_dir, 'data', 'divisions.json')
 
-        with open(teams_file, 'r', encoding='utf-8') as f:
-            teams = json.load(f)
+        with open(teams_file, 'rb') as f:
+            teams = json_loads(f.read())
 
-        with open(divisions_file, 'r', encoding='utf-8') as f:
-            divisions_data = json.load(f)
+        with open(divisions_file, 'rb') as f:
+            divisions_data = json_loads(f.read())
 
         team_to_division = divisions_data['team_to_division']
 
+        # Division team names are normalized once for all exact and fuzzy lookups
+        normalized_div_names = [self.normalize_team_name(name) for name in team_to_division]
+        div_divisions = list(team_to_division.values())
+
+        # Exact matches are a dict lookup (first entry wins if two names normalize alike)
+        exact_divisions = {}
+        for div_name, division in zip(normalized_div_names, div_divisions):
+            exact_divisions.setdefault(div_name, division)
+
+        # Per-team messages are collected and written in one go after the loop
+        log_lines = []
+
         for team in teams:
             team_name = team['name']
             division_found = None
             best_match_score = 0
             best_match_division = None
 
+            normalized_team_name = self.normalize_team_name(team_name)
+
             # Try exact match first
-            for div_team_name, division in team_to_division.items():
-                if self.normalize_team_name(team_name) == self.normalize_team_name(div_team_name):
-                    division_found = division
-                    break
+            division_found = exact_divisions.get(normalized_team_name)
 
             # Try fuzzy matching
             if not division_found:
-                for div_team_name, division in team_to_division.items():
-                    score = self.similarity(self.normalize_team_name(team_name), self.normalize_team_name(div_team_name))
+                if RAPIDFUZZ_SUPPORT:
+                    # fuzz.ratio is never below difflib's ratio, so names it scores under the
+                    # 0.7 threshold (with some float margin) can't match and are dropped early.
+                    # The rest are still scored with difflib, in division order, so the result
+                    # doesn't depend on whether rapidfuzz is installed
+                    candidates = sorted(match[2] for match in process.extract(
+                        normalized_team_name, normalized_div_names,
+                        scorer=fuzz.ratio, score_cutoff=69, limit=None))
+                else:
+                    candidates = range(len(normalized_div_names))
+
+                team_name_len = len(normalized_team_name)
+                for index in candidates:
+                    div_name = normalized_div_names[index]
+
+                    # The ratio is at most 2*min(len)/total, so names too different in length
+                    # to beat both the current best and the 0.7 threshold are skipped
+                    total_len = team_name_len + len(div_name)
+                    if total_len and 2 * min(team_name_len, len(div_name)) / total_len <= max(best_match_score, 0.7):
+                        continue
+
+                    score = self.similarity(normalized_team_name, div_name)
                     if score > best_match_score:
                         best_match_score = score
-                        best_match_division = division
+                        best_match_division = div_divisions[index]
+
+                        # Nothing can beat a perfect score, so stop scanning
+                        if score >= 1.0:
+                            break
 
                 if best_match_score > 0.7:
                     division_found = best_match_division
-                    print(f"  Fuzzy match: '{team_name}' -> '{best_match_division}' (score: {best_match_score:.2f})")
+                    log_lines.append(f"  Fuzzy match: '{team_name}' -> '{best_match_division}' (score: {best_match_score:.2f})")
 
             # Add division
             if division_found:
                 team['division'] = division_found
-                print(f"  ✓ {team_name} -> {division_found}")
+                log_lines.append(f"  ✓ {team_name} -> {division_found}")
             else:
                 team['division'] = "Unknown"
-                print(f"  ✗ No division found for: {team_name}")
+                log_lines.append(f"  ✗ No division found for: {team_name}")
 
-        # Save updated teams
-        with open(teams_file, 'w', encoding='utf-8') as f:
-            json.dump(teams, f, indent=2, ensure_ascii=False)
+        if log_lines:
+            print('\n'.join(log_lines))
+
+        # Save updated teams (via a temp file so an interrupted write can't truncate teams.json)
+        tmp_file = f"{teams_file}.tmp"
+        write_json(tmp_file, teams)
+        os.replace(tmp_file, teams_file)
 
         # Print summary
-        division_counts = {}
-        for team in teams:
-            div = team['division']
-            division_counts[div] = division_counts.get(div, 0) + 1
+        division_counts = Counter(team['division'] for team in teams)
 
         print("\nDivision Summary:")
         for division, count in division_counts.items():
@@ -1062,6 +1460,9 @@ class DivisionAssigner:
 class FormationDetector:
     """Analyzes goals and assists to detect forward trios and defense duos"""
 
+    # Positions listed first when ordering powerplay unit players
+    FORWARD_POSITIONS = frozenset(('LW', 'C', 'RW', 'F'))
+
     def __init__(self, games_data):
         self.games = games_data
         self.team_formations = defaultdict(lambda: {
@@ -1073,23 +1474,28 @@ class FormationDetector:
             'goal_scoring_pairs': defaultdict(lambda: {'goals': 0}),  # Track assist->goal pairs
             'player_positions': {}
         })
+        self._formation_cache = {}
 
     def analyze_formations(self):
         """Main method to analyze all formations"""
         print("Analyzing player formations from goals and assists...")
+        self._formation_cache.clear()
 
+        # self.games may be a generator, so games are counted as they are consumed
+        games_count = 0
         for game in self.games:
-            if 'boxscore' not in game:
+            games_count += 1
+            boxscore = game.get('boxscore')
+            if not boxscore:
                 continue
 
-            self._build_position_map(game)
-            self._analyze_goals(game)
+            self._build_position_map(game, boxscore.get('teams') or [])
+            self._analyze_goals(boxscore.get('goals') or [])
 
-        print(f"Formation analysis completed for {len(self.team_formations)} teams")
+        print(f"Formation analysis completed for {len(self.team_formations)} teams from {games_count} games")
 
-    def _build_position_map(self, game):
+    def _build_position_map(self, game, teams):
         """Build position mapping for players in this game"""
-        teams = game.get('boxscore', {}).get('teams', [])
         if len(teams) < 2:
             return
 
@@ -1098,8 +1504,12 @@ class FormationDetector:
 
         for roster_key in ['home_team_roster', 'away_team_roster']:
             team_id = home_team_id if roster_key == 'home_team_roster' else away_team_id
+            roster = game.get(roster_key, [])
 
-            for player in game.get(roster_key, []):
+            # Looked up on the first kept player, so teams without one get no formations entry
+            player_positions = None
+
+            for player in roster:
                 player_id = player.get('participantId')
                 if not player_id:
                     continue
@@ -1114,23 +1524,30 @@ class FormationDetector:
 
                 participant = player.get('participant', {})
                 player_name = participant.get('fullName', 'Unknown')
+                number = player.get('number')
+
+                if player_positions is None:
+                    player_positions = self.team_formations[team_id]['player_positions']
+
+                # Keep the existing entry when nothing changed since the last game
+                existing = player_positions.get(player_id)
+                if (existing and existing['name'] == player_name
+                        and existing['position'] == position and existing['number'] == number):
+                    continue
 
-                self.team_formations[team_id]['player_positions'][player_id] = {
+                player_positions[player_id] = {
                     'name': player_name,
                     'position': position,
-                    'number': player.get('number')
+                    'number': number
                 }
 
-    def _analyze_goals(self, game):
+    def _analyze_goals(self, goals):
         """Analyze each goal for formation patterns"""
-        boxscore = game.get('boxscore', {})
-
-        for goal in boxscore.get('goals', []):
+        for goal in goals:
             team_id = goal.get('teamId')
             if not team_id:
                 continue
 
-            players_involved = []
             participant = goal.get('participant', {})
             scorer_id = participant.get('participantId')
 
@@ -1138,8 +1555,6 @@ class FormationDetector:
             if not scorer_id:
                 continue
 
-            players_involved.append(scorer_id)
-
             # Track goal-scoring pairs (primary assist to scorer)
             assists = goal.get('assists', [])
             if assists and len(assists) > 0:
@@ -1149,195 +1564,96 @@ class FormationDetector:
 
                 if primary_assist_id:
                     # Create pair key (always sorted for consistency)
-                    pair_key = tuple(sorted([primary_assist_id, scorer_id]))
-                    self.team_formations[team_id]['goal_scoring_pairs'][pair_key]['goals'] += 1
+                    key = sorted_pair(primary_assist_id, scorer_id)
+                    self.team_formations[team_id]['goal_scoring_pairs'][key]['goals'] += 1
 
-            for assist in assists:
-                assist_id = assist.get('participantId')
-                if assist_id:
-                    players_involved.append(assist_id)
+            # Assist ids are extracted once and shared by every formation detector
+            assist_ids = [assist.get('participantId') for assist in assists if assist.get('participantId')]
 
-            self._detect_formations_in_goal(team_id, players_involved, goal)
+            self._detect_formations_in_goal(team_id, scorer_id, assist_ids, goal)
 
-    def _detect_formations_in_goal(self, team_id, players_involved, goal):
+    def _detect_formations_in_goal(self, team_id, scorer_id, assist_ids, goal):
         """Detect formation patterns in a single goal"""
-        if len(players_involved) < 2:
+        if not assist_ids:
             return
 
-        team_data = self.team_formations[team_id]
-        positioned_players = []
-
-        for player_id in players_involved:
-            if player_id in team_data['player_positions']:
-                player_info = team_data['player_positions'][player_id]
-                positioned_players.append({
-                    'id': player_id,
-                    'name': player_info['name'],
-                    'position': player_info['position']
-                })
+        player_positions = self.team_formations[team_id]['player_positions']
+        positioned_ids = [player_id for player_id in [scorer_id] + assist_ids if player_id in player_positions]
 
-        if len(positioned_players) < 2:
+        if len(positioned_ids) < 2:
             return
 
         is_powerplay = goal.get('isPowerplay', False)
         is_shorthanded = goal.get('isShorthanded', False)
 
-        forwards = [p for p in positioned_players if p['position'] == 'F']
-        defensemen = [p for p in positioned_players if p['position'] == 'D']
-
         if is_powerplay:
-            self._detect_powerplay_units(team_id, positioned_players, goal)
+            self._detect_powerplay_units(team_id, positioned_ids, scorer_id, assist_ids)
         elif is_shorthanded:
-            self._detect_penalty_kill_units(team_id, positioned_players, goal)
+            self._detect_penalty_kill_units(team_id, positioned_ids, scorer_id, assist_ids)
         else:
-            self._detect_even_strength_formations(team_id, forwards, defensemen, goal)
-
-    def _detect_even_strength_formations(self, team_id, forwards, defensemen, goal):
+            forwards = []
+            defensemen = []
+            for player_id in positioned_ids:
+                position = player_positions[player_id]['position']
+                if position == 'F':
+                    forwards.append(player_id)
+                elif position == 'D':
+                    defensemen.append(player_id)
+
+            # Even strength formations need at least two skaters at the same position
+            if len(forwards) >= 2 or len(defensemen) >= 2:
+                self._detect_even_strength_formations(team_id, forwards, defensemen, scorer_id, assist_ids)
+
+    def _detect_even_strength_formations(self, team_id, forwards, defensemen, scorer_id, assist_ids):
         """Detect even strength formations"""
         team_data = self.team_formations[team_id]
 
-        # Calculate total points from this goal (1 goal + number of assists)
-        goal_points = 1  # The goal itself
-        assist_points = len(goal.get('assists', []))
-        total_points = goal_points + assist_points
-
-        # Get scorer ID safely
-        participant = goal.get('participant', {})
-        scorer_id = participant.get('participantId')
-        if not scorer_id:
-            return
-
-        if len(forwards) >= 3:
-            for trio in combinations(forwards, 3):
-                trio_key = tuple(sorted([p['id'] for p in trio]))
-                # Check how many players from this trio were involved in the goal
-                trio_ids = set([p['id'] for p in trio])
-                involved_players = set()
-
-                # Add scorer if in trio
-                if scorer_id in trio_ids:
-                    involved_players.add(scorer_id)
-                    team_data['even_strength_f_trios'][trio_key]['goals'] += 1
-
-                # Add assists if in trio
-                for assist in goal.get('assists', []):
-                    assist_id = assist.get('participantId')
-                    if assist_id and assist_id in trio_ids:
-                        involved_players.add(assist_id)
-                        team_data['even_strength_f_trios'][trio_key]['assists'] += 1
-
-                # Update total points
-                if involved_players:
-                    team_data['even_strength_f_trios'][trio_key]['points'] = (
-                        team_data['even_strength_f_trios'][trio_key]['goals'] +
-                        team_data['even_strength_f_trios'][trio_key]['assists']
-                    )
-
-        if len(forwards) >= 2:
-            for pair in combinations(forwards, 2):
-                pair_key = tuple(sorted([p['id'] for p in pair]))
-                pair_ids = set([p['id'] for p in pair])
-                involved_players = set()
-
-                # Add scorer if in pair
-                if scorer_id in pair_ids:
-                    involved_players.add(scorer_id)
-                    team_data['even_strength_f_pairs'][pair_key]['goals'] += 1
-
-                # Add assists if in pair
-                for assist in goal.get('assists', []):
-                    assist_id = assist.get('participantId')
-                    if assist_id and assist_id in pair_ids:
-                        involved_players.add(assist_id)
-                        team_data['even_strength_f_pairs'][pair_key]['assists'] += 1
-
-                # Update total points
-                if involved_players:
-                    team_data['even_strength_f_pairs'][pair_key]['points'] = (
-                        team_data['even_strength_f_pairs'][pair_key]['goals'] +
-                        team_data['even_strength_f_pairs'][pair_key]['assists']
-                    )
+        # Forward pairs and trios are enumerated together: each trio extends a pair
+        f_pairs = team_data['even_strength_f_pairs']
+        f_trios = team_data['even_strength_f_trios']
+        num_forwards = len(forwards)
+        for i in range(num_forwards):
+            for j in range(i + 1, num_forwards):
+                pair = (forwards[i], forwards[j])
+                self._tally_formation(f_pairs, pair, scorer_id, assist_ids)
+                for k in range(j + 1, num_forwards):
+                    self._tally_formation(f_trios, pair + (forwards[k],), scorer_id, assist_ids)
 
         if len(defensemen) >= 2:
             for pair in combinations(defensemen, 2):
-                pair_key = tuple(sorted([p['id'] for p in pair]))
-                pair_ids = set([p['id'] for p in pair])
-                involved_players = set()
+                self._tally_formation(team_data['even_strength_d_duos'], pair, scorer_id, assist_ids)
 
-                # Add scorer if in pair
-                if scorer_id in pair_ids:
-                    involved_players.add(scorer_id)
-                    team_data['even_strength_d_duos'][pair_key]['goals'] += 1
+    @staticmethod
+    def _tally_formation(formations, player_ids, scorer_id, assist_ids):
+        """Credit a goal's scorer and assists to the formation made of player_ids"""
+        goals = 1 if scorer_id in player_ids else 0
+        assists = sum(1 for assist_id in assist_ids if assist_id in player_ids)
 
-                # Add assists if in pair
-                for assist in goal.get('assists', []):
-                    assist_id = assist.get('participantId')
-                    if assist_id and assist_id in pair_ids:
-                        involved_players.add(assist_id)
-                        team_data['even_strength_d_duos'][pair_key]['assists'] += 1
-
-                # Update total points
-                if involved_players:
-                    team_data['even_strength_d_duos'][pair_key]['points'] = (
-                        team_data['even_strength_d_duos'][pair_key]['goals'] +
-                        team_data['even_strength_d_duos'][pair_key]['assists']
-                    )
-
-    def _detect_powerplay_units(self, team_id, players, goal):
-        """Detect powerplay units"""
-        team_data = self.team_formations[team_id]
-        unit_key = tuple(sorted([p['id'] for p in players]))
-        unit_ids = set([p['id'] for p in players])
-
-        # Get scorer ID safely
-        participant = goal.get('participant', {})
-        scorer_id = participant.get('participantId')
-        if not scorer_id:
+        # Only formations with at least one involved player are recorded
+        if not goals and not assists:
             return
 
-        # Add scorer if in unit
-        if scorer_id in unit_ids:
-            team_data['powerplay_units'][unit_key]['goals'] += 1
-
-        # Add assists if in unit
-        for assist in goal.get('assists', []):
-            assist_id = assist.get('participantId')
-            if assist_id and assist_id in unit_ids:
-                team_data['powerplay_units'][unit_key]['assists'] += 1
+        if len(player_ids) == 2:
+            key = sorted_pair(*player_ids)
+        elif len(player_ids) == 3:
+            key = sorted_trio(*player_ids)
+        else:
+            key = tuple(sorted(player_ids))
+        stats = formations[key]
+        stats['goals'] += goals
+        stats['assists'] += assists
 
-        # Update total points
-        team_data['powerplay_units'][unit_key]['points'] = (
-            team_data['powerplay_units'][unit_key]['goals'] +
-            team_data['powerplay_units'][unit_key]['assists']
-        )
+    def _detect_powerplay_units(self, team_id, players, scorer_id, assist_ids):
+        """Detect powerplay units"""
+        self._detect_special_teams_unit(team_id, 'powerplay_units', players, scorer_id, assist_ids)
 
-    def _detect_penalty_kill_units(self, team_id, players, goal):
+    def _detect_penalty_kill_units(self, team_id, players, scorer_id, assist_ids):
         """Detect penalty kill units"""
-        team_data = self.team_formations[team_id]
-        unit_key = tuple(sorted([p['id'] for p in players]))
-        unit_ids = set([p['id'] for p in players])
-
-        # Get scorer ID safely
-        participant = goal.get('participant', {})
-        scorer_id = participant.get('participantId')
-        if not scorer_id:
-            return
-
-        # Add scorer if in unit
-        if scorer_id in unit_ids:
-            team_data['penalty_kill_units'][unit_key]['goals'] += 1
+        self._detect_special_teams_unit(team_id, 'penalty_kill_units', players, scorer_id, assist_ids)
 
-        # Add assists if in unit
-        for assist in goal.get('assists', []):
-            assist_id = assist.get('participantId')
-            if assist_id and assist_id in unit_ids:
-                team_data['penalty_kill_units'][unit_key]['assists'] += 1
-
-        # Update total points
-        team_data['penalty_kill_units'][unit_key]['points'] = (
-            team_data['penalty_kill_units'][unit_key]['goals'] +
-            team_data['penalty_kill_units'][unit_key]['assists']
-        )
+    def _detect_special_teams_unit(self, team_id, unit_type, players, scorer_id, assist_ids):
+        """Credit a powerplay or penalty kill goal to the unit on the ice"""
+        self._tally_formation(self.team_formations[team_id][unit_type], players, scorer_id, assist_ids)
 
 
     def get_team_formations(self, team_id):
@@ -1345,15 +1661,27 @@ class FormationDetector:
         if team_id not in self.team_formations:
             return None
 
+        # Rankings only change when formations are re-analyzed
+        if team_id in self._formation_cache:
+            return self._formation_cache[team_id]
+
         team_data = self.team_formations[team_id]
 
-        return {
+        # Points are derived once here rather than on every credited goal
+        for formation_type in ('even_strength_f_trios', 'even_strength_f_pairs', 'even_strength_d_duos',
+                               'powerplay_units', 'penalty_kill_units'):
+            for stats in team_data[formation_type].values():
+                stats['points'] = stats['goals'] + stats['assists']
+
+        formations = {
             'forward_lines': self._get_ranked_forward_lines(team_data),
             'defense_pairs': self._get_ranked_defense_pairs(team_data),
             'powerplay_units': self._get_ranked_powerplay_units(team_data),
             'penalty_kill_units': self._get_ranked_penalty_kill_units(team_data),
             'goal_scoring_pairs': self._get_top_goal_scoring_pairs(team_data)
         }
+        self._formation_cache[team_id] = formations
+        return formations
 
     def _calculate_dominance_scores(self, formations_list, scores_trios, scores_pairs):
         """
@@ -1368,24 +1696,17 @@ class FormationDetector:
             Updated formations_list with dominance scores
         """
         # STEP 1: Calculate total raw score of all found formations
+        # For all types, use their points as raw score
         total_score = 0
-
         for formation in formations_list:
-            formation_type = formation.get('type', 'trio')
-
-            # Determine raw score based on formation type
-            # For all types, use their points as raw score
             raw_score = formation.get('points', 0)
-
             formation['raw_score'] = raw_score
             total_score += raw_score
 
         # STEP 2: Calculate and add dominance score to each formation
         if total_score > 0:
             for formation in formations_list:
-                raw_score = formation.get('raw_score', 0)
-                dominance_score = (raw_score / total_score) * 100
-                formation['dominance_score'] = round(dominance_score, 1)
+                formation['dominance_score'] = round((formation['raw_score'] / total_score) * 100, 1)
         else:
             # If no total score, set all dominance scores to 0
             for formation in formations_list:
@@ -1404,9 +1725,14 @@ class FormationDetector:
         Returns:
             List of deduced trios
         """
+        player_positions = team_data['player_positions']
         deduced_trios = []
         used_pairs = set()
 
+        # A triangle needs at least three pairs
+        if len(pairs_dict) < 3:
+            return deduced_trios, used_pairs
+
         # Build a graph of connections
         player_connections = defaultdict(dict)
         for pair_key, stats in pairs_dict.items():
@@ -1415,59 +1741,69 @@ class FormationDetector:
                 player_connections[p1][p2] = {'stats': stats, 'pair_key': pair_key}
                 player_connections[p2][p1] = {'stats': stats, 'pair_key': pair_key}
 
-        # Find triangles (3 players all connected to each other)
+        if len(player_connections) < 3:
+            return deduced_trios, used_pairs
+
+        # Find triangles (3 players all connected to each other), visiting them in
+        # player order: only common neighbours are checked, not every later player
         players = list(player_connections.keys())
-        for i, p1 in enumerate(players):
-            for j, p2 in enumerate(players[i+1:], i+1):
-                if p2 in player_connections[p1]:
-                    # p1 and p2 are connected, check for common connections
-                    for p3 in players[j+1:]:
-                        if p3 in player_connections[p1] and p3 in player_connections[p2]:
-                            # Found a triangle: p1-p2-p3
-                            pair_keys = [
-                                player_connections[p1][p2]['pair_key'],
-                                player_connections[p1][p3]['pair_key'],
-                                player_connections[p2][p3]['pair_key']
-                            ]
-
-                            # Skip if any pair already used
-                            if any(pk in used_pairs for pk in pair_keys):
-                                continue
-
-                            # Get stats for all three pairs
-                            stats_list = [
-                                player_connections[p1][p2]['stats'],
-                                player_connections[p1][p3]['stats'],
-                                player_connections[p2][p3]['stats']
-                            ]
-
-                            # Calculate combined stats (use best pair as representative)
-                            best_stats = max(stats_list, key=lambda s: s['points'])
-
-                            # Get player info
-                            players_info = []
-                            for pid in sorted([p1, p2, p3]):
-                                if pid in team_data['player_positions']:
-                                    players_info.append(team_data['player_positions'][pid])
-
-                            if len(players_info) == 3:
-                                deduced_trios.append({
-                                    'players': players_info,
-                                    'goals': best_stats['goals'],
-                                    'assists': best_stats['assists'],
-                                    'points': best_stats['points'],
-                                    'type': 'deduced_trio',
-                                    'key': tuple(sorted([p1, p2, p3])),
-                                    'source_pairs': pair_keys
-                                })
-
-                                # Mark these pairs as used
-                                used_pairs.update(pair_keys)
+        player_order = {player: index for index, player in enumerate(players)}
+        order_key = player_order.__getitem__
+        for p1 in players:
+            p1_order = player_order[p1]
+            later_neighbors = sorted((p for p in player_connections[p1] if player_order[p] > p1_order), key=order_key)
+            for p2 in later_neighbors:
+                # p1 and p2 are connected, check for common connections
+                p2_order = player_order[p2]
+                common = player_connections[p1].keys() & player_connections[p2].keys()
+                for p3 in sorted((p for p in common if player_order[p] > p2_order), key=order_key):
+                    # Found a triangle: p1-p2-p3
+                    pair_keys = [
+                        player_connections[p1][p2]['pair_key'],
+                        player_connections[p1][p3]['pair_key'],
+                        player_connections[p2][p3]['pair_key']
+                    ]
+
+                    # Skip if any pair already used
+                    if not used_pairs.isdisjoint(pair_keys):
+                        continue
+
+                    # Get stats for all three pairs
+                    stats_list = [
+                        player_connections[p1][p2]['stats'],
+                        player_connections[p1][p3]['stats'],
+                        player_connections[p2][p3]['stats']
+                    ]
+
+                    # Calculate combined stats (use best pair as representative)
+                    best_stats = max(stats_list, key=lambda s: s['points'])
+
+                    # Get player info
+                    key = sorted_trio(p1, p2, p3)
+                    players_info = []
+                    for pid in key:
+                        if pid in player_positions:
+                            players_info.append(player_positions[pid])
+
+                    if len(players_info) == 3:
+                        deduced_trios.append({
+                            'players': players_info,
+                            'goals': best_stats['goals'],
+                            'assists': best_stats['assists'],
+                            'points': best_stats['points'],
+                            'type': 'deduced_trio',
+                            'key': key,
+                            'source_pairs': pair_keys
+                        })
+
+                        # Mark these pairs as used
+                        used_pairs.update(pair_keys)
 
         return deduced_trios, used_pairs
 
     def _get_ranked_forward_lines(self, team_data):
         """Get forward lines ranked by points"""
+        player_positions = team_data['player_positions']
         lines = []
         scores_trios = {}
         scores_pairs = {}
@@ -1479,8 +1815,8 @@ class FormationDetector:
                 if stats['goals'] > 0:
                     players = []
                     for player_id in trio_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) == 3:
                         lines.append({
@@ -1532,8 +1868,8 @@ class FormationDetector:
                 if stats['goals'] > 0 and pair_key not in used_pair_keys:
                     players = []
                     for player_id in pair_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) == 2:
                         lines.append({
@@ -1549,12 +1885,12 @@ class FormationDetector:
         # Calculate dominance scores
         lines = self._calculate_dominance_scores(lines, scores_trios, scores_pairs)
 
-        # Sort by points descending, then by dominance score
-        lines.sort(key=lambda x: (x['points'], x.get('dominance_score', 0)), reverse=True)
+        # Keep the best lines by points, then by dominance score
+        lines = heapq.nlargest(3, lines, key=lambda x: (x['points'], x.get('dominance_score', 0)))
 
         # Add rank (Line 1, Line 2, Line 3, etc.)
         ranked_lines = []
-        for i, line in enumerate(lines[:3]):  # Top 3 lines
+        for i, line in enumerate(lines):  # Top 3 lines
             line['rank'] = f"Line {i + 1}"
             # Remove internal keys used for calculation
             if 'key' in line:
@@ -1567,6 +1903,7 @@ class FormationDetector:
 
     def _get_ranked_defense_pairs(self, team_data):
         """Get defense pairs ranked by goals"""
+        player_positions = team_data['player_positions']
         pairs = []
 
         # Get all defense pairs with goals > 0
@@ -1575,8 +1912,8 @@ class FormationDetector:
                 if stats['goals'] > 0:
                     players = []
                     for player_id in pair_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) == 2:
                         pairs.append({
@@ -1586,12 +1923,12 @@ class FormationDetector:
                             'points': stats['points']
                         })
 
-        # Sort by goals descending
-        pairs.sort(key=lambda x: x['goals'], reverse=True)
+        # Keep the best pairs by goals
+        pairs = heapq.nlargest(2, pairs, key=lambda x: x['goals'])
 
         # Add rank (D1, D2, etc.)
         ranked_pairs = []
-        for i, pair in enumerate(pairs[:2]):  # Top 2 pairs
+        for i, pair in enumerate(pairs):  # Top 2 pairs
             pair['rank'] = f"D{i + 1}"
             ranked_pairs.append(pair)
 
@@ -1599,6 +1936,7 @@ class FormationDetector:
 
     def _get_ranked_powerplay_units(self, team_data):
         """Get powerplay units ranked by goals"""
+        player_positions = team_data['player_positions']
         units = []
         scores_units = {}
 
@@ -1608,12 +1946,12 @@ class FormationDetector:
                 if stats['goals'] > 0:
                     players = []
                     for player_id in unit_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) >= 2:  # At least 2 players
                         # Sort players: Forwards (F) first, then Defensemen (D)
-                        players.sort(key=lambda p: (0 if p['position'] in ['LW', 'C', 'RW', 'F'] else 1, p['name']))
+                        players.sort(key=lambda p: (0 if p['position'] in self.FORWARD_POSITIONS else 1, p['name']))
 
                         units.append({
                             'players': players,
@@ -1628,12 +1966,12 @@ class FormationDetector:
         # Calculate dominance scores
         units = self._calculate_dominance_scores(units, scores_units, {})
 
-        # Sort by points descending, then by dominance score
-        units.sort(key=lambda x: (x['points'], x.get('dominance_score', 0)), reverse=True)
+        # Keep the best units by points, then by dominance score
+        units = heapq.nlargest(3, units, key=lambda x: (x['points'], x.get('dominance_score', 0)))
 
         # Add rank (PP1, PP2, etc.)
         ranked_units = []
-        for i, unit in enumerate(units[:3]):  # Top 3 units
+        for i, unit in enumerate(units):  # Top 3 units
             unit['rank'] = f"PP{i + 1}"
             # Remove internal key used for calculation
             if 'key' in unit:
@@ -1644,6 +1982,7 @@ class FormationDetector:
 
     def _get_ranked_penalty_kill_units(self, team_data):
         """Get penalty kill units ranked by goals"""
+        player_positions = team_data['player_positions']
         units = []
 
         # Get all PK units with goals > 0
@@ -1652,8 +1991,8 @@ class FormationDetector:
                 if stats['goals'] > 0:
                     players = []
                     for player_id in unit_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) >= 2:  # At least 2 players
                         units.append({
@@ -1663,12 +2002,12 @@ class FormationDetector:
                             'points': stats['points']
                         })
 
-        # Sort by goals descending
-        units.sort(key=lambda x: x['goals'], reverse=True)
+        # Keep the best units by goals
+        units = heapq.nlargest(3, units, key=lambda x: x['goals'])
 
         # Add rank (PK1, PK2, etc.)
         ranked_units = []
-        for i, unit in enumerate(units[:3]):  # Top 3 units
+        for i, unit in enumerate(units):  # Top 3 units
             unit['rank'] = f"PK{i + 1}"
             ranked_units.append(unit)
 
@@ -1676,6 +2015,7 @@ class FormationDetector:
 
     def _get_top_goal_scoring_pairs(self, team_data):
         """Get top 5 goal-scoring pairs ranked by number of goals"""
+        player_positions = team_data['player_positions']
         pairs = []
 
         # Get all goal-scoring pairs with goals > 0
@@ -1684,8 +2024,8 @@ class FormationDetector:
                 if stats['goals'] > 0:
                     players = []
                     for player_id in pair_key:
-                        if player_id in team_data['player_positions']:
-                            players.append(team_data['player_positions'][player_id])
+                        if player_id in player_positions:
+                            players.append(player_positions[player_id])
 
                     if len(players) == 2:
                         pairs.append({
@@ -1693,11 +2033,8 @@ class FormationDetector:
                             'goals': stats['goals']
                         })
 
-        # Sort by goals descending
-        pairs.sort(key=lambda x: x['goals'], reverse=True)
-
-        # Return top 5 pairs
-        return pairs[:5]
+        # Return top 5 pairs by goals
+        return heapq.nlargest(5, pairs, key=lambda x: x['goals'])
 
     def export_formations(self, output_file):
         """Export formations to JSON file"""
@@ -1706,8 +2043,7 @@ class FormationDetector:
         for team_id in self.team_formations:
             formations_data[team_id] = self.get_team_formations(team_id)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(formations_data, f, indent=2, ensure_ascii=False)
+        write_json(output_file, formations_data)
 
         print(f"Formations exported to {output_file}")
 
@@ -1719,27 +2055,27 @@ class FormationDetector:
 def main():
     """Main function to orchestrate the complete workflow"""
 
-    parser = argparse.ArgumentParser(
+    arg_parser = argparse.ArgumentParser(
         description='LHEQ Hockey Statistics Compiler - Process game data and generate website statistics'
     )
-    parser.add_argument(
+    arg_parser.add_argument(
         '--step',
         choices=['goalies', 'stats', 'divisions', 'formations', 'all'],
         default='all',
         help='Run a specific step or all steps (default: all)'
     )
-    parser.add_argument(
+    arg_parser.add_argument(
         '--skip-goalies',
         action='store_true',
         help='Skip goalie parsing step'
     )
-    parser.add_argument(
+    arg_parser.add_argument(
         '--skip-logos',
         action='store_true',
         help='Skip logo download step'
     )
 
-    args = parser.parse_args()
+    args = arg_parser.parse_args()
 
     # Configuration
     games_dir = "web/data/games"
@@ -1772,12 +2108,9 @@ def main():
             print("\n" + "=" * 70)
             print("STEP 2: COMPILING TEAM AND PLAYER STATISTICS")
             print("=" * 70)
-            compiler = HockeyStatsCompiler(games_dir, web_dir)
+            compiler = HockeyStatsCompiler(games_dir, web_dir, skip_logos=args.skip_logos)
             compiler.compile_all()
 
-            if args.skip_logos:
-                print("(Skipped logo download as requested)")
-
             print("✓ Statistics compilation completed")
 
         # Step 3: Assign Divisions
@@ -1795,24 +2128,9 @@ def main():
             print("STEP 4: ANALYZING LINE COMBINATIONS")
             print("=" * 70)
 
-            # Load games
+            # Analyze formations, streaming games from disk instead of loading them all first
             print("Loading game files for formation analysis...")
-            games = []
-            for filename in os.listdir(games_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(games_dir, filename)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            game_data = json.load(f)
-                            if game_data.get('status') == 'FINAL' and 'boxscore' in game_data:
-                                games.append(game_data)
-                    except Exception as e:
-                        print(f"  Error loading {filename}: {e}")
-
-            print(f"Loaded {len(games)} games for formation analysis")
-
-            # Analyze formations
-            detector = FormationDetector(games)
+            detector = FormationDetector(iter_final_games(games_dir))
             detector.analyze_formations()
 
             # Export results
@@ -1827,6 +2145,11 @@ def main():
         print("You can now open web/index.html in a browser to view the statistics.")
         print()
 
+    except KeyboardInterrupt:
+        # Leave immediately: no traceback and no waiting on reader threads or freeing loaded data
+        print("\n✗ Interrupted")
+        sys.stdout.flush()
+        os._exit(130)
     except Exception as e:
         print(f"\n✗ ERROR: {e}")
         import traceback